@@ -6,6 +6,7 @@ Provides endpoint for converting chord chart PDFs.
 """
 import io
 import os
+import time
 import uuid
 import asyncio
 import traceback
@@ -46,14 +47,14 @@ def run_component_diagnostic(name: str, test_func) -> Dict[str, Any]:
     Returns:
         Diagnostic result dictionary
     """
-    start_time = datetime.now()
+    start_ns = time.perf_counter_ns()
     try:
         result = test_func()
         return {
             "name": name,
             "status": "ok",
             "message": result if isinstance(result, str) else "Component loaded successfully",
-            "duration_ms": (datetime.now() - start_time).total_seconds() * 1000
+            "duration_ms": (time.perf_counter_ns() - start_ns) / 1e6
         }
     except Exception as e:
         return {
@@ -61,7 +62,7 @@ def run_component_diagnostic(name: str, test_func) -> Dict[str, Any]:
             "status": "error",
             "message": str(e),
             "error_type": type(e).__name__,
-            "duration_ms": (datetime.now() - start_time).total_seconds() * 1000
+            "duration_ms": (time.perf_counter_ns() - start_ns) / 1e6
         }
 
 
@@ -250,6 +251,9 @@ TEMP_DIR = Path("/tmp/nashville_converter")
 # File size limit (10 MB)
 MAX_FILE_SIZE = 10 * 1024 * 1024
 
+# PDF readers accept the %PDF- header anywhere in the first 1024 bytes
+PDF_HEADER_SEARCH_BYTES = 1024
+
 
 def ensure_temp_dir():
     """
@@ -345,6 +349,47 @@ def validate_pdf_file(file: UploadFile) -> None:
         )
 
 
+def validate_upload_size(contents: bytes) -> None:
+    """
+    Reject uploads over MAX_FILE_SIZE before any parsing.
+
+    Args:
+        contents: Raw bytes of the uploaded file
+
+    Raises:
+        HTTPException: If the file is too large
+    """
+    if len(contents) > MAX_FILE_SIZE:
+        raise HTTPException(
+            status_code=413,
+            detail=f"File too large. Maximum size is {MAX_FILE_SIZE / (1024*1024):.0f} MB."
+        )
+
+
+def validate_pdf_contents(contents: bytes) -> None:
+    """
+    Validate uploaded PDF bytes before any parsing.
+
+    Both checks work on the buffer in place: len() is O(1) and the bounded
+    find() scans the header region without copying a slice of it. Used by
+    /convert; /validate only checks the size and reports files without a
+    PDF header in its response body instead of as an HTTP error.
+
+    Args:
+        contents: Raw bytes of the uploaded file
+
+    Raises:
+        HTTPException: If the file is too large or has no PDF header
+    """
+    validate_upload_size(contents)
+
+    if contents.find(b'%PDF-', 0, PDF_HEADER_SEARCH_BYTES) == -1:
+        raise HTTPException(
+            status_code=400,
+            detail="File is not a valid PDF. Please upload a PDF file."
+        )
+
+
 @api_router.get("/", response_model=HealthResponse)
 async def root():
     """
@@ -438,12 +483,28 @@ async def convert_pdf(
                 "step": current_step
             }
         )
+
     result = None
     try:
+        # Read the upload and reject oversized or non-PDF files before parsing
+        current_step = "file_upload"
+        input_file_bytes = await file.read()
+        try:
+            validate_pdf_contents(input_file_bytes)
+        except HTTPException as e:
+            raise HTTPException(
+                status_code=e.status_code,
+                detail={
+                    "error": e.detail,
+                    "trace_id": trace_id,
+                    "step": current_step,
+                    "file_size_bytes": len(input_file_bytes)
+                }
+            )
+
         # Process the PDF
         current_step = "pdf_processing"
         try:
-            input_file_bytes = await file.read()
             result = get_pdf_processor().process_pdf(
                 input_file_bytes,
                 key=key,
@@ -497,6 +558,10 @@ async def convert_pdf(
                 }
             )
 
+    except HTTPException:
+        # Re-raise HTTP exceptions
+        raise
+
     except Exception as e:
         # Get error message safely
         try:
@@ -563,53 +628,26 @@ async def validate_pdf_endpoint(
             }
         )
 
-    # Ensure temp directory exists (lazy initialization for serverless)
-    current_step = "temp_directory_setup"
     try:
-        ensure_temp_dir()
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail={
-                "error": f"Failed to create temp directory: {str(e)}",
-                "trace_id": trace_id,
-                "step": current_step
-            }
-        )
-
-    # Generate unique ID for temp file
-    file_id = str(uuid.uuid4())
-    input_path = TEMP_DIR / f"validate_{file_id}.pdf"
-
-    try:
-        # Save uploaded file temporarily
+        # Read the upload into memory; validation never touches the disk
         current_step = "file_upload"
         contents = await file.read()
-        if len(contents) > MAX_FILE_SIZE:
+        try:
+            validate_upload_size(contents)
+        except HTTPException as e:
             raise HTTPException(
-                status_code=413,
+                status_code=e.status_code,
                 detail={
-                    "error": f"File too large. Maximum size is {MAX_FILE_SIZE / (1024*1024):.0f} MB.",
+                    "error": e.detail,
                     "trace_id": trace_id,
                     "step": current_step,
                     "file_size_bytes": len(contents)
                 }
             )
 
-        current_step = "file_save"
-        with open(input_path, "wb") as f:
-            f.write(contents)
-
         # Validate the PDF
         current_step = "pdf_validation"
-        validation_result = get_pdf_processor().validate_pdf(str(input_path))
-
-        # Clean up safely
-        try:
-            if input_path.exists():
-                input_path.unlink()
-        except Exception:
-            pass  # Ignore cleanup errors
+        validation_result = get_pdf_processor().validate_pdf_bytes(contents)
 
         # Add trace_id to the response
         if isinstance(validation_result, dict):
@@ -619,22 +657,9 @@ async def validate_pdf_endpoint(
 
     except HTTPException:
         # Re-raise HTTP exceptions
-        # Clean up safely
-        try:
-            if input_path.exists():
-                input_path.unlink()
-        except Exception:
-            pass
         raise
 
     except Exception as e:
-        # Clean up safely
-        try:
-            if input_path.exists():
-                input_path.unlink()
-        except Exception:
-            pass
-
         # Get error details safely
         try:
             error_msg = str(e)
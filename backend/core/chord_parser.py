@@ -7,12 +7,18 @@ Supports standard Western music chord notation.
 
 import re
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional, List
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Chord:
-    """Represents a parsed chord with its components."""
+    """
+    Represents a parsed chord with its components.
+
+    Immutable, so parsed chords can be cached and shared between callers,
+    and slotted, so each instance carries no per-instance __dict__.
+    """
     root: str  # Root note: C, D, Eb, F#, etc.
     quality: str = ""  # maj, min, m, dim, aug, sus, etc.
     extensions: str = ""  # 7, 9, 11, 13, etc.
@@ -30,16 +36,24 @@ class Chord:
 
 # Comprehensive chord regex pattern
 # Matches: C, Cm, Cmaj7, C7, Csus4, Cadd9, C#m7, Db, D/F#, Gmaj7#11, etc.
+# Digits are spelled [0-9]: chord numbers are ASCII, and the explicit class
+# is cheaper than \d's Unicode digit lookup. \s stays Unicode-aware to
+# agree with str.strip and str.split.
 CHORD_PATTERN = re.compile(
     r'([A-G][b#]?)'  # Root note (required): A-G with optional flat/sharp
-    r'(maj|min|m|dim|aug|Maj|Min|M|sus(?!\d))?'  # Quality (optional) - sus only if NOT followed by digit
-    r'(\d{1,2})?'  # Extension (optional): 7, 9, 11, 13
-    r'(b\d+|#\d+|add\d{1,2}|sus\d)?'  # Alterations (optional): b5, #9, add9, sus4, sus2
+    r'(maj|min|m|dim|aug|Maj|Min|M|sus(?![0-9]))?'  # Quality (optional) - sus only if NOT followed by digit
+    r'([0-9]{1,2})?'  # Extension (optional): 7, 9, 11, 13
+    r'(b[0-9]+|#[0-9]+|add[0-9]{1,2}|sus[0-9])?'  # Alterations (optional): b5, #9, add9, sus4, sus2
     r'(/[A-G][b#]?)?'  # Slash chord (optional): /E, /F#
     r'(?=\s|$|[,.])'  # Lookahead: must be followed by space, end, or punctuation
 )
 
 
+# Whitespace-delimited words whose first character after any leading
+# punctuation is a note letter - the only words that can be chords
+CHORD_CANDIDATE_PATTERN = re.compile(r'(?<!\S)[.,!?;:()]*([A-G]\S*)')
+
+
 # Notes that are valid chord roots
 VALID_ROOTS = {
     'A', 'A#', 'Ab', 'B', 'Bb', 'C', 'C#', 'Cb',
@@ -67,6 +81,23 @@ def parse_chord(text: str) -> Optional[Chord]:
         Chord(root='G', quality='', extensions='', alterations='', bass='B')
     """
     text = text.strip()
+
+    # Only strings starting with a note letter can match; rejecting the rest
+    # here keeps lyric words out of the regex and the parse cache
+    if not text or text[0] not in 'ABCDEFG':
+        return None
+
+    return _parse_stripped_chord(text)
+
+
+@lru_cache(maxsize=512)
+def _parse_stripped_chord(text: str) -> Optional[Chord]:
+    """
+    Parse an already stripped chord string; see parse_chord.
+
+    Cached: charts and callers parse the same few chord spellings over and
+    over, and Chord is immutable so one instance can be shared.
+    """
     match = CHORD_PATTERN.match(text)
 
     if not match:
@@ -110,53 +141,70 @@ def parse_chord(text: str) -> Optional[Chord]:
     return chord
 
 
-def is_likely_chord(text: str) -> bool:
+# Common words that might start with A-G but aren't chords
+NON_CHORD_WORDS = frozenset({
+    'Am', 'A', 'As', 'An', 'And', 'At', 'All', 'Away',
+    'Be', 'But', 'By', 'Been',
+    'Can', 'Come',
+    'Do', 'Don', 'Down',
+    'For', 'From',
+    'Go', 'Get', 'Got'
+})
+
+
+def match_chord(text: str) -> Optional[Chord]:
     """
-    Heuristic to determine if text is likely a chord symbol.
+    Apply the is_likely_chord heuristics and parse the chord in one pass.
 
-    This helps distinguish chords from lyrics or other text.
+    Extraction loops would otherwise call is_likely_chord and then
+    parse_chord on every word, running the chord regex twice; this returns
+    the parsed chord from the single match instead.
 
     Args:
         text: String to evaluate
 
     Returns:
-        True if text appears to be a chord, False otherwise
-
-    Heuristics:
-        - Matches chord regex pattern
-        - Short length (< 10 characters)
-        - Starts with capital letter A-G
-        - Doesn't contain common non-chord words
+        Chord object if text appears to be a chord, None otherwise
     """
     text = text.strip()
 
     # Length check - chords are typically short
     if len(text) > 10 or len(text) == 0:
-        return False
-
-    # Must start with a note letter
-    if not text[0] in 'ABCDEFG':
-        return False
-
-    # Common words that might start with A-G but aren't chords
-    non_chord_words = {
-        'Am', 'A', 'As', 'An', 'And', 'At', 'All', 'Away',
-        'Be', 'But', 'By', 'Been',
-        'Can', 'Come',
-        'Do', 'Don', 'Down',
-        'For', 'From',
-        'Go', 'Get', 'Got'
-    }
+        return None
+
+    # Must start with a note letter; most lyric words stop here
+    if text[0] not in 'ABCDEFG':
+        return None
 
     # Special handling: 'A', 'Am', 'C' etc. could be chords or words
     # If it's exactly 'A' followed by space or line break, context matters
     # For MVP, we prioritize chord matching
-    if text in non_chord_words and len(text) > 2:
-        return False
+    if len(text) > 2 and text in NON_CHORD_WORDS:
+        return None
+
+    return parse_chord(text)
+
+
+def is_likely_chord(text: str) -> bool:
+    """
+    Heuristic to determine if text is likely a chord symbol.
+
+    This helps distinguish chords from lyrics or other text. Use match_chord
+    when the parsed chord is needed as well.
+
+    Args:
+        text: String to evaluate
+
+    Returns:
+        True if text appears to be a chord, False otherwise
 
-    # Try to parse as chord
-    chord = parse_chord(text)
-    return chord is not None
+    Heuristics:
+        - Matches chord regex pattern
+        - Short length (< 10 characters)
+        - Starts with capital letter A-G
+        - Doesn't contain common non-chord words
+    """
+    return match_chord(text) is not None
 
 
 def extract_chords_from_text(text: str) -> List[Chord]:
@@ -173,19 +221,32 @@ def extract_chords_from_text(text: str) -> List[Chord]:
         >>> extract_chords_from_text("C Am F G")
         [Chord(root='C'...), Chord(root='A', quality='m'...), ...]
     """
-    words = text.split()
     chords = []
 
-    for word in words:
+    # Scan the text once for candidate words rather than splitting it and
+    # testing every word; lyric words that can't start a chord are skipped
+    # inside the regex engine
+    for candidate in CHORD_CANDIDATE_PATTERN.finditer(text):
         # Remove common punctuation that might be attached
-        cleaned = word.strip('.,!?;:()')
-        chord = parse_chord(cleaned)
-        if chord and is_likely_chord(cleaned):
+        cleaned = candidate.group(1).rstrip('.,!?;:()')
+        chord = match_chord(cleaned)
+        if chord:
             chords.append(chord)
 
     return chords
 
 
+# Enharmonic equivalents
+SHARP_ENHARMONICS = {
+    'Db': 'C#', 'Eb': 'D#', 'Gb': 'F#', 'Ab': 'G#', 'Bb': 'A#',
+    'Cb': 'B', 'Fb': 'E', 'E#': 'F', 'B#': 'C'
+}
+FLAT_ENHARMONICS = {
+    'C#': 'Db', 'D#': 'Eb', 'F#': 'Gb', 'G#': 'Ab', 'A#': 'Bb',
+    'B': 'Cb', 'E': 'Fb', 'F': 'E#', 'C': 'B#'
+}
+
+
 def normalize_enharmonic(note: str, prefer_sharps: bool = True) -> str:
     """
     Normalize enharmonic equivalents.
@@ -203,18 +264,7 @@ def normalize_enharmonic(note: str, prefer_sharps: bool = True) -> str:
         >>> normalize_enharmonic("C#", prefer_sharps=False)
         'Db'
     """
-    # Enharmonic equivalents
-    if prefer_sharps:
-        enharmonic_map = {
-            'Db': 'C#', 'Eb': 'D#', 'Gb': 'F#', 'Ab': 'G#', 'Bb': 'A#',
-            'Cb': 'B', 'Fb': 'E', 'E#': 'F', 'B#': 'C'
-        }
-    else:
-        enharmonic_map = {
-            'C#': 'Db', 'D#': 'Eb', 'F#': 'Gb', 'G#': 'Ab', 'A#': 'Bb',
-            'B': 'Cb', 'E': 'Fb', 'F': 'E#', 'C': 'B#'
-        }
-
+    enharmonic_map = SHARP_ENHARMONICS if prefer_sharps else FLAT_ENHARMONICS
     return enharmonic_map.get(note, note)
 
 
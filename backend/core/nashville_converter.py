@@ -5,7 +5,10 @@ Converts chord symbols to Nashville Number System notation.
 Handles major and minor keys, chord qualities, and slash chords.
 """
 
-from typing import Optional, Tuple
+from collections import Counter
+from functools import lru_cache
+from operator import attrgetter
+from typing import Callable, List, Optional, Tuple
 from backend.core.chord_parser import Chord, parse_chord
 
 
@@ -18,6 +21,14 @@ FLAT_TO_SHARP = {
     'Cb': 'B', 'Fb': 'E', 'E#': 'F', 'B#': 'C'
 }
 
+# Every note spelling normalize_note accepts
+ALL_NOTES = tuple(CHROMATIC) + tuple(FLAT_TO_SHARP)
+
+# Chromatic index of every note spelling, sharps and flats alike
+CHROMATIC_INDEX = {
+    note: CHROMATIC.index(FLAT_TO_SHARP.get(note, note)) for note in ALL_NOTES
+}
+
 # Major scale intervals (in semitones from root)
 MAJOR_SCALE_INTERVALS = [0, 2, 4, 5, 7, 9, 11]  # 1, 2, 3, 4, 5, 6, 7
 
@@ -82,10 +93,48 @@ def get_chromatic_index(note: str) -> int:
         >>> get_chromatic_index("F#")
         6
     """
-    normalized = normalize_note(note)
-    if normalized not in CHROMATIC:
+    try:
+        return CHROMATIC_INDEX[note]
+    except KeyError:
         raise ValueError(f"Invalid note: {note}")
-    return CHROMATIC.index(normalized)
+
+
+def _degrees_by_distance(scale_intervals) -> Tuple[Tuple[int, bool], ...]:
+    """
+    Tabulate (scale_degree, is_chromatic) for each semitone distance 0-11
+    from the key.
+
+    Args:
+        scale_intervals: Scale intervals in semitones from the root
+
+    Returns:
+        12-tuple of (scale_degree, is_chromatic), indexed by semitone distance
+    """
+    table = []
+    for semitone_distance in range(12):
+        # Check if this semitone distance matches a diatonic scale degree
+        if semitone_distance in scale_intervals:
+            table.append((scale_intervals.index(semitone_distance) + 1, False))
+            continue
+
+        # If not diatonic, find the closest scale degree
+        # This handles chromatic chords like bII, #IV, bVII, etc.
+        closest_degree = 1
+        min_distance = 12
+
+        for degree_idx, interval in enumerate(scale_intervals):
+            distance = abs(semitone_distance - interval)
+            if distance < min_distance:
+                min_distance = distance
+                closest_degree = degree_idx + 1
+
+        table.append((closest_degree, True))
+    return tuple(table)
+
+
+# (scale_degree, is_chromatic) by semitone distance from the key
+MAJOR_SCALE_DEGREES = _degrees_by_distance(MAJOR_SCALE_INTERVALS)
+MINOR_SCALE_DEGREES = _degrees_by_distance(MINOR_SCALE_INTERVALS)
 
 
 def calculate_scale_degree(root: str, key: str, mode: str = "major") -> Tuple[int, bool]:
@@ -108,32 +157,25 @@ def calculate_scale_degree(root: str, key: str, mode: str = "major") -> Tuple[in
         >>> calculate_scale_degree("Eb", "C", "major")
         (3, True)   # Eb is chromatic (b3) in C major
     """
-    root_index = get_chromatic_index(root)
-    key_index = get_chromatic_index(key)
-
     # Calculate semitone distance from key
-    semitone_distance = (root_index - key_index) % 12
-
-    # Select scale intervals based on mode
-    scale_intervals = MAJOR_SCALE_INTERVALS if mode == "major" else MINOR_SCALE_INTERVALS
-
-    # Check if this semitone distance matches a diatonic scale degree
-    if semitone_distance in scale_intervals:
-        scale_degree = scale_intervals.index(semitone_distance) + 1
-        return (scale_degree, False)
-
-    # If not diatonic, find the closest scale degree
-    # This handles chromatic chords like bII, #IV, bVII, etc.
-    closest_degree = 1
-    min_distance = 12
-
-    for degree_idx, interval in enumerate(scale_intervals):
-        distance = abs(semitone_distance - interval)
-        if distance < min_distance:
-            min_distance = distance
-            closest_degree = degree_idx + 1
-
-    return (closest_degree, True)
+    semitone_distance = (get_chromatic_index(root) - get_chromatic_index(key)) % 12
+
+    # Degrees for every distance are tabulated per mode at import
+    scale_degrees = MAJOR_SCALE_DEGREES if mode == "major" else MINOR_SCALE_DEGREES
+    return scale_degrees[semitone_distance]
+
+
+# Nashville marker for each (lowercased) chord quality
+# In Nashville notation, we ALWAYS show: m (minor), dim, aug, sus
+# We show 'maj' only for major 7th chords (maj7, maj9, etc.)
+QUALITY_MARKERS = {
+    'm': 'm',
+    'min': 'm',
+    'dim': 'dim',
+    'aug': 'aug',
+    'maj': 'maj',
+    'sus': 'sus',
+}
 
 
 def format_scale_degree(
@@ -169,18 +211,11 @@ def format_scale_degree(
     number = str(degree)
 
     # Add quality markers
-    # In Nashville notation, we ALWAYS show: m (minor), dim, aug, sus
-    # We show 'maj' only for major 7th chords (maj7, maj9, etc.)
-    if chord_quality in ['m', 'min']:
-        number += 'm'
-    elif chord_quality == 'dim':
-        number += 'dim'
-    elif chord_quality == 'aug':
-        number += 'aug'
-    elif chord_quality in ['maj', 'M']:
+    marker = QUALITY_MARKERS.get(chord_quality)
+    if marker is not None:
         # Explicit major only with extensions (e.g., Imaj7)
-        if chord.extensions:
-            number += 'maj'
+        if marker != 'maj' or chord.extensions:
+            number += marker
     elif 'sus' in chord_quality:
         number += chord_quality  # Include sus2, sus4, etc.
 
@@ -240,6 +275,50 @@ def convert_chord_to_nashville(
     return nashville_num
 
 
+def make_converter(key, mode: str = "major") -> Callable[[Chord], str]:
+    """
+    Build a chord converter specialized to one key and mode.
+
+    The scale degree of every note spelling is computed up front, so each
+    conversion is a dict lookup plus formatting instead of re-deriving the
+    key's position for every chord. Key and mode may be plain strings or
+    MusicKey/MusicalMode members.
+
+    Args:
+        key: Key of the song
+        mode: "major" or "minor"
+
+    Returns:
+        Function converting a Chord to its Nashville number string, with the
+        same results and errors as convert_chord_to_nashville
+
+    Example:
+        >>> convert = make_converter("C", "major")
+        >>> convert(parse_chord("G/B"))
+        '5/7'
+    """
+    key = getattr(key, 'value', key)
+    mode = getattr(mode, 'value', mode)
+
+    degrees = {}
+    if validate_key(key):
+        degrees = {note: calculate_scale_degree(note, key, mode) for note in ALL_NOTES}
+
+    def convert(chord: Chord) -> str:
+        # Unknown notes fall through to calculate_scale_degree's ValueError
+        degree, is_chromatic = degrees.get(chord.root) or calculate_scale_degree(chord.root, key, mode)
+        nashville_num = format_scale_degree(degree, chord, is_chromatic, mode)
+
+        if chord.bass:
+            bass_degree, _ = degrees.get(chord.bass) or calculate_scale_degree(chord.bass, key, mode)
+            nashville_num += f"/{bass_degree}"
+
+        return nashville_num
+
+    return convert
+
+
+@lru_cache(maxsize=1024)
 def convert_text_to_nashville(
     text: str,
     key: str,
@@ -248,6 +327,9 @@ def convert_text_to_nashville(
     """
     Convenience function to parse and convert a chord string.
 
+    Results are memoized per (text, key, mode); invalid keys still raise on
+    every call since exceptions are not cached.
+
     Args:
         text: Chord string (e.g., "Dm7")
         key: Key of the song
@@ -266,6 +348,37 @@ def convert_text_to_nashville(
     return convert_chord_to_nashville(chord, key, mode)
 
 
+def convert_many_to_nashville(
+    texts: List[str],
+    key: str,
+    mode: str = "major"
+) -> List[Optional[str]]:
+    """
+    Parse and convert a sequence of chord strings in one key.
+
+    Batch form of convert_text_to_nashville: the key's scale degrees are
+    computed once for the whole sequence via make_converter.
+
+    Args:
+        texts: Chord strings (e.g., ["C", "G/B", "Am"])
+        key: Key of the song
+        mode: "major" or "minor"
+
+    Returns:
+        Nashville number strings parallel to texts, None where parsing fails
+
+    Example:
+        >>> convert_many_to_nashville(["C", "G/B", "Am"], "C", "major")
+        ['1', '5/7', '6m']
+    """
+    convert = make_converter(key, mode)
+    results = []
+    for text in texts:
+        chord = parse_chord(text)
+        results.append(convert(chord) if chord else None)
+    return results
+
+
 def get_key_signature_preference(key: str) -> str:
     """
     Determine whether a key typically uses sharps or flats.
@@ -353,19 +466,20 @@ def detect_mode_from_chords(chords: list, key: str) -> str:
     if first_chord.root == key and first_chord.quality in ['m', 'min']:
         return "minor"
 
-    # Count how many chords match expected qualities
+    # Count how many chords match expected qualities. Songs repeat a few
+    # chords, so tally each distinct (root, quality) once with its count.
     major_matches = 0
     minor_matches = 0
 
-    for chord in chords:
-        degree, _ = calculate_scale_degree(chord.root, key, "major")
+    for (root, quality), count in Counter(map(attrgetter('root', 'quality'), chords)).items():
+        degree, _ = calculate_scale_degree(root, key, "major")
         expected_major = MAJOR_KEY_QUALITIES.get(degree, '')
         expected_minor = MINOR_KEY_QUALITIES.get(degree, '')
 
-        if chord.quality == expected_major:
-            major_matches += 1
-        if chord.quality == expected_minor:
-            minor_matches += 1
+        if quality == expected_major:
+            major_matches += count
+        if quality == expected_minor:
+            minor_matches += count
 
     # Return the mode with more matches
     return "minor" if minor_matches > major_matches else "major"
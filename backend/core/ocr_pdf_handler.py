@@ -10,7 +10,7 @@ This prevents import errors in serverless environments where system dependencies
 """
 
 from typing import List, Dict, Any, Tuple, TYPE_CHECKING
-from backend.core.chord_parser import parse_chord, is_likely_chord
+from backend.core.chord_parser import match_chord
 from backend.core.text_pdf_handler import ChordAnnotation
 
 if TYPE_CHECKING:
@@ -81,12 +81,8 @@ def extract_chords_from_scanned_pdf(pdf_path: str, dpi: int = 150) -> Tuple[List
                 if not text:
                     continue
 
-                # Check if this word is likely a chord
-                if not is_likely_chord(text):
-                    continue
-
-                # Parse the chord
-                chord = parse_chord(text)
+                # Check if this word is likely a chord and parse it
+                chord = match_chord(text)
                 if not chord:
                     continue
 
@@ -5,19 +5,28 @@ Main orchestrator for converting chord chart PDFs to Nashville Number System.
 Handles both text-based and scanned PDFs.
 """
 
+import copy
+import hashlib
 import os
-from typing import Dict, Any, List
+import threading
+from collections import OrderedDict
+from itertools import islice
+from typing import Dict, Any, List, Tuple
 from backend.core.text_pdf_handler import (
+    ChordAnnotation,
     extract_chords_from_text_pdf,
     detect_if_text_pdf,
-    filter_false_positives
+    filter_false_positives,
+    iter_text_pdf_chords,
+    open_text_pdf,
+    sample_rules_out_chords
 )
 from backend.core.pdf_renderer import (
     render_text_pdf_with_nashville,
     estimate_render_quality
 )
 from backend.core.nashville_converter import (
-    convert_chord_to_nashville,
+    make_converter,
     validate_key
 )
 from models.types import MusicKey, MusicalMode
@@ -28,6 +37,20 @@ class PDFProcessingError(Exception):
     pass
 
 
+# Number of chords validate_pdf reports as a sample
+VALIDATION_SAMPLE_SIZE = 5
+
+# Number of recently processed PDFs whose extracted chords are kept, so a
+# retried upload, or the same chart converted to another key, skips
+# detection and extraction
+EXTRACTION_CACHE_SIZE = 8
+
+NO_CHORDS_MESSAGE = (
+    "No chords detected in PDF. Please ensure the PDF contains chord symbols "
+    "and is not encrypted or corrupted."
+)
+
+
 class PDFProcessor:
     """
     Main class for processing chord chart PDFs.
@@ -35,7 +58,11 @@ class PDFProcessor:
 
     def __init__(self):
         """Initialize the PDF processor."""
-        pass
+        # SHA-1 of the input bytes -> (filtered chord annotations, metadata)
+        self._extraction_cache = OrderedDict()
+        # The API shares one processor across concurrent requests, and the
+        # cache's lookup, reordering and eviction must not interleave
+        self._extraction_lock = threading.Lock()
 
     def process_pdf(
         self,
@@ -60,47 +87,48 @@ class PDFProcessor:
         Raises:
             PDFProcessingError: If processing fails
         """
-        # Check if PDF is text-based
-        is_text_based = detect_if_text_pdf(input_file_bytes)
-
-        if not is_text_based:
-            raise PDFProcessingError(
-                "This PDF appears to be a scanned image. Only text-based PDFs are supported. "
-                "Please use a PDF with selectable text (not a scanned image)."
-            )
-
-        # Extract chords from text-based PDF
-        try:
-            chord_annotations, metadata = extract_chords_from_text_pdf(input_file_bytes)
-            processing_method = "text_extraction"
-        except Exception as e:
-            raise PDFProcessingError(f"Failed to extract chords: {str(e)}")
-
-        # Filter false positives
-        chord_annotations = filter_false_positives(chord_annotations)
-
-        # Check if any chords were found
-        if not chord_annotations:
-            raise PDFProcessingError(
-                "No chords detected in PDF. Please ensure the PDF contains chord symbols "
-                "and is not encrypted or corrupted."
-            )
+        # Reuse the chords extracted from an identical upload if still cached
+        digest = hashlib.sha1(input_file_bytes).digest()
+        with self._extraction_lock:
+            cached = self._extraction_cache.get(digest)
+            if cached is not None:
+                self._extraction_cache.move_to_end(digest)
+        if cached is not None:
+            chord_annotations, metadata = cached
+        else:
+            # Extract outside the lock so other uploads are not held up
+            chord_annotations, metadata = self._extract_chords(input_file_bytes)
+            with self._extraction_lock:
+                self._extraction_cache[digest] = (chord_annotations, metadata)
+                if len(self._extraction_cache) > EXTRACTION_CACHE_SIZE:
+                    self._extraction_cache.popitem(last=False)
+        processing_method = "text_extraction"
 
         # Convert chords to Nashville numbers
         nashville_numbers = []
         conversion_errors = []
 
+        # Songs repeat a handful of chords many times; key and mode are fixed
+        # for the document, so each distinct chord symbol is converted once
+        conversions = {}
+        convert = make_converter(key, mode)
+
         for annotation in chord_annotations:
-            try:
-                nashville = convert_chord_to_nashville(annotation.chord, key, mode)
-                nashville_numbers.append(nashville)
-            except Exception as e:
-                # If conversion fails for a specific chord, keep original
+            text = annotation.text
+            if text not in conversions:
+                try:
+                    conversions[text] = (convert(annotation.chord), None)
+                except Exception as e:
+                    # If conversion fails for a specific chord, keep original
+                    conversions[text] = (text, str(e))  # Fallback to original
+
+            nashville, error = conversions[text]
+            if error is not None:
                 conversion_errors.append({
-                    'chord': annotation.text,
-                    'error': str(e)
+                    'chord': text,
+                    'error': error
                 })
-                nashville_numbers.append(annotation.text)  # Fallback to original
+            nashville_numbers.append(nashville)
 
         # Render output PDF
         try:
@@ -126,10 +154,61 @@ class PDFProcessor:
             'total_chords_converted': len(nashville_numbers),
             'conversion_errors': conversion_errors,
             'quality_metrics': quality_metrics,
-            'metadata': metadata,
+            # A copy: the cached metadata must not change if a caller edits it
+            'metadata': copy.deepcopy(metadata),
             "result_file_bytes": result_file_bytes,
         }
 
+    def _extract_chords(self, input_file_bytes: bytes) -> Tuple[List[ChordAnnotation], Dict[str, Any]]:
+        """
+        Detect, extract and filter the chords of a text-based PDF.
+
+        Args:
+            input_file_bytes: Raw bytes of the PDF file
+
+        Returns:
+            Tuple of (filtered chord annotations, PDF metadata)
+
+        Raises:
+            PDFProcessingError: If the PDF is scanned, unreadable or has no chords
+        """
+        # Open the PDF once: detection and extraction share the parsed
+        # document, including the first page's layout
+        pdf = open_text_pdf(input_file_bytes)
+        try:
+            # Check if PDF is text-based
+            is_text_based = detect_if_text_pdf(input_file_bytes, pdf=pdf)
+
+            if not is_text_based:
+                raise PDFProcessingError(
+                    "This PDF appears to be a scanned image. Only text-based PDFs are supported. "
+                    "Please use a PDF with selectable text (not a scanned image)."
+                )
+
+            # Fail fast on long documents whose first and last pages have
+            # text but nothing that could be a chord, instead of extracting
+            # every page in between
+            if pdf is not None and sample_rules_out_chords(pdf):
+                raise PDFProcessingError(NO_CHORDS_MESSAGE)
+
+            # Extract chords from text-based PDF
+            try:
+                chord_annotations, metadata = extract_chords_from_text_pdf(input_file_bytes, pdf=pdf)
+            except Exception as e:
+                raise PDFProcessingError(f"Failed to extract chords: {str(e)}")
+        finally:
+            if pdf is not None:
+                pdf.close()
+
+        # Filter false positives
+        chord_annotations = filter_false_positives(chord_annotations)
+
+        # Check if any chords were found
+        if not chord_annotations:
+            raise PDFProcessingError(NO_CHORDS_MESSAGE)
+
+        return chord_annotations, metadata
+
     def validate_pdf(self, pdf_path: str) -> Dict[str, Any]:
         """
         Validate a PDF and return information about it.
@@ -146,33 +225,61 @@ class PDFProcessor:
                 'error': 'File not found'
             }
 
-        # Check if it's text-based
-        is_text_based = detect_if_text_pdf(pdf_path)
+        with open(pdf_path, 'rb') as pdf_file:
+            pdf_bytes = pdf_file.read()
 
-        if not is_text_based:
-            return {
-                'valid': False,
-                'error': 'PDF is scanned/image-based. Only text-based PDFs are supported.',
-                'is_text_based': False
-            }
+        return self.validate_pdf_bytes(pdf_bytes)
+
+    def validate_pdf_bytes(self, pdf_bytes: bytes) -> Dict[str, Any]:
+        """
+        Validate an in-memory PDF and return information about it.
 
-        # Try to extract a few chords as a test
+        Args:
+            pdf_bytes: Raw bytes of the PDF file
+
+        Returns:
+            Dictionary with PDF validation results
+        """
+        # Open the PDF once for both detection and the sample extraction
+        pdf = open_text_pdf(pdf_bytes)
         try:
-            chords, metadata = extract_chords_from_text_pdf(pdf_path)
+            # Check if it's text-based
+            is_text_based = detect_if_text_pdf(pdf_bytes, pdf=pdf)
 
-            return {
-                'valid': True,
-                'is_text_based': True,
-                'num_pages': metadata.get('num_pages', 0),
-                'sample_chords_found': min(len(chords), 5),
-                'sample_chords': [c.text for c in chords[:5]]
-            }
+            if not is_text_based:
+                return {
+                    'valid': False,
+                    'error': 'PDF is scanned/image-based. Only text-based PDFs are supported.',
+                    'is_text_based': False
+                }
 
-        except Exception as e:
-            return {
-                'valid': False,
-                'error': str(e)
-            }
+            # Try to extract a few chords as a test
+            try:
+                if pdf is not None:
+                    # Only parse as many pages as it takes to fill the sample
+                    num_pages = len(pdf.pages)
+                    chords = list(islice(iter_text_pdf_chords(pdf), VALIDATION_SAMPLE_SIZE))
+                else:
+                    chords, metadata = extract_chords_from_text_pdf(pdf_bytes)
+                    num_pages = metadata.get('num_pages', 0)
+                    chords = chords[:VALIDATION_SAMPLE_SIZE]
+
+                return {
+                    'valid': True,
+                    'is_text_based': True,
+                    'num_pages': num_pages,
+                    'sample_chords_found': len(chords),
+                    'sample_chords': [c.text for c in chords]
+                }
+
+            except Exception as e:
+                return {
+                    'valid': False,
+                    'error': str(e)
+                }
+        finally:
+            if pdf is not None:
+                pdf.close()
 
 
 def get_supported_keys() -> List[str]:
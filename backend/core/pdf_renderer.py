@@ -10,8 +10,106 @@ during cold starts.
 """
 
 import io
-from typing import List, Dict, Any
-from backend.core.text_pdf_handler import ChordAnnotation, get_font_mapping, estimate_text_width
+from collections import defaultdict
+from operator import itemgetter
+from typing import List, Dict, Any, Tuple
+from backend.core.text_pdf_handler import ChordAnnotation, get_font_mapping, estimate_text_widths
+
+
+def _group_by_page(
+    chord_annotations: List[ChordAnnotation],
+    nashville_numbers: List[str]
+) -> Dict[int, List[tuple]]:
+    """
+    Group (annotation, nashville) pairs by page number in a single pass.
+
+    Args:
+        chord_annotations: List of detected chords with positions
+        nashville_numbers: Nashville number strings parallel to chord_annotations
+
+    Returns:
+        Dictionary mapping page number to its (ChordAnnotation, nashville) tuples
+    """
+    chords_by_page: Dict[int, List[tuple]] = defaultdict(list)
+    for annotation, nashville in zip(chord_annotations, nashville_numbers):
+        chords_by_page[annotation.page_number].append((annotation, nashville))
+    return chords_by_page
+
+
+# Prefix of the resource names the overlay's fonts are registered under on
+# each output page. Re-rendering an already converted PDF reuses the same
+# names for the same standard fonts, so replacing them is harmless.
+OVERLAY_FONT_PREFIX = "/Nashville"
+
+
+def _pdf_number(value: float) -> str:
+    """Format a number for a PDF content stream."""
+    return ('%.4f' % value).rstrip('0').rstrip('.')
+
+
+def _pdf_string(text: str) -> str:
+    """Encode text as a PDF literal string for a standard (WinAnsi) font."""
+    encoded = text.encode('cp1252', 'replace').decode('latin-1')
+    escaped = encoded.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+    return f"({escaped})"
+
+
+def _stamp_overlay(pdf_writer, page, content: bytes, fonts: List[str], font_objects: Dict[str, Any]) -> None:
+    """
+    Draw overlay content on top of a page already added to pdf_writer.
+
+    The overlay's drawing operators are appended to the page's /Contents
+    after its original content, which is wrapped in q/Q. Nothing is parsed
+    or re-serialized: the page's existing (compressed) streams are
+    referenced unchanged and only two small streams are added.
+
+    Args:
+        pdf_writer: PdfWriter the page belongs to
+        page: Output page returned by pdf_writer.add_page
+        content: Content stream operators from build_overlay_content
+        fonts: reportlab standard font names the content uses
+        font_objects: Per-document cache of font dictionaries added to
+            pdf_writer, keyed by font name
+    """
+    from PyPDF2.generic import ArrayObject, DecodedStreamObject, DictionaryObject, NameObject
+
+    # Pages may share a resources dictionary, so register the fonts in a
+    # per-page copy of it
+    resources = DictionaryObject(page['/Resources'].get_object()) if '/Resources' in page else DictionaryObject()
+    page_fonts = DictionaryObject(resources['/Font'].get_object()) if '/Font' in resources else DictionaryObject()
+    for font_name in fonts:
+        if font_name not in font_objects:
+            font_objects[font_name] = pdf_writer._add_object(DictionaryObject({
+                NameObject('/Type'): NameObject('/Font'),
+                NameObject('/Subtype'): NameObject('/Type1'),
+                NameObject('/BaseFont'): NameObject('/' + font_name),
+                NameObject('/Encoding'): NameObject('/WinAnsiEncoding'),
+            }))
+        page_fonts[NameObject(OVERLAY_FONT_PREFIX + font_name)] = font_objects[font_name]
+    resources[NameObject('/Font')] = page_fonts
+    page[NameObject('/Resources')] = resources
+
+    # /Contents may be an indirect reference to an array of streams; resolve
+    # it before checking its type, but keep a lone stream referenced as is
+    contents = page.get('/Contents')
+    if contents is None:
+        original_streams = []
+    elif isinstance(contents.get_object(), ArrayObject):
+        original_streams = list(contents.get_object())
+    else:
+        original_streams = [contents]
+
+    push = DecodedStreamObject()
+    push.set_data(b"q\n")
+    pop_and_draw = DecodedStreamObject()
+    pop_and_draw.set_data(b"\nQ\n" + content)
+    pop_and_draw = pop_and_draw.flate_encode()
+
+    page[NameObject('/Contents')] = ArrayObject(
+        [pdf_writer._add_object(push)]
+        + original_streams
+        + [pdf_writer._add_object(pop_and_draw)]
+    )
 
 
 def render_text_pdf_with_nashville(
@@ -50,62 +148,57 @@ def render_text_pdf_with_nashville(
     try:
         input_buffer = io.BytesIO(io_bytes)
         output_buffer = io.BytesIO()
-        # Read original PDF
+        # Read original PDF. Resolve the page list once rather than going
+        # through the reader's lazy page view on every access.
         pdf_reader = PdfReader(input_buffer)
+        source_pages = list(pdf_reader.pages)
+        num_pages = len(source_pages)
         pdf_writer = PdfWriter()
 
         # Validate inputs
-        if not pdf_reader.pages:
+        if not source_pages:
             raise ValueError("PDF has no pages")
 
         # Group chords by page
-        chords_by_page: Dict[int, List[tuple]] = {}
-        for annotation, nashville in zip(chord_annotations, nashville_numbers):
-            page_num = annotation.page_number
-            if page_num not in chords_by_page:
-                chords_by_page[page_num] = []
-            chords_by_page[page_num].append((annotation, nashville))
+        chords_by_page = _group_by_page(chord_annotations, nashville_numbers)
+
+        # Get page sizes with fallback to letter size
+        page_sizes = {}
+        for page_num in chords_by_page:
+            page_width, page_height = 612, 792  # Default letter size
+            if metadata and 'page_sizes' in metadata:
+                if page_num < len(metadata['page_sizes']):
+                    page_size = metadata['page_sizes'][page_num]
+                    page_width = page_size.get('width', 612)
+                    page_height = page_size.get('height', 792)
+            page_sizes[page_num] = (page_width, page_height)
+
+        # Font dictionaries shared by every page's overlay
+        font_objects = {}
 
         # Process each page
-        for page_num in range(len(pdf_reader.pages)):
+        for page_num, original_page in enumerate(source_pages):
             try:
-                original_page = pdf_reader.pages[page_num]
-
-                # Get page size with fallback
-                page_width, page_height = 612, 792  # Default letter size
-                if metadata and 'page_sizes' in metadata:
-                    if page_num < len(metadata['page_sizes']):
-                        page_size = metadata['page_sizes'][page_num]
-                        page_width = page_size.get('width', 612)
-                        page_height = page_size.get('height', 792)
-
-                # Create overlay with Nashville numbers
-                if page_num in chords_by_page and chords_by_page[page_num]:
+                # Add to output
+                output_page = pdf_writer.add_page(original_page)
+
+                # Draw Nashville numbers directly onto the output page
+                if chords_by_page.get(page_num):
                     try:
-                        overlay_buffer = create_chord_overlay(
-                            chords_by_page[page_num],
-                            page_width,
-                            page_height
+                        page_width, page_height = page_sizes[page_num]
+                        content, fonts = build_overlay_content(
+                            chords_by_page[page_num], page_width, page_height
                         )
-
-                        # Read the overlay
-                        overlay_pdf = PdfReader(overlay_buffer)
-                        if overlay_pdf.pages:
-                            overlay_page = overlay_pdf.pages[0]
-                            # Merge overlay onto original page
-                            original_page.merge_page(overlay_page)
+                        _stamp_overlay(pdf_writer, output_page, content, fonts, font_objects)
                     except Exception as overlay_error:
-                        # Continue without overlay for this page if creation fails
+                        # Continue without overlay for this page if it fails
                         # The original page will still be included
                         pass
 
-                # Add to output
-                pdf_writer.add_page(original_page)
-
             except Exception as page_error:
                 # If a single page fails, try to continue with others
                 # Re-raise if it's the first/only page
-                if page_num == 0 and len(pdf_reader.pages) == 1:
+                if page_num == 0 and num_pages == 1:
                     raise
                 continue
 
@@ -137,6 +230,126 @@ def render_text_pdf_with_nashville(
             raise Exception(f"Failed to render PDF: {error_msg}")
 
 
+def build_overlay_content(
+    page_chords: List[tuple],
+    page_width: float,
+    page_height: float
+) -> Tuple[bytes, List[str]]:
+    """
+    Build the content stream that whites out one page's chords and draws
+    their Nashville numbers.
+
+    The operators are written directly instead of through a reportlab canvas,
+    so no overlay PDF has to be generated and parsed back per render.
+
+    Args:
+        page_chords: List of (ChordAnnotation, nashville_string) tuples for this page
+        page_width: Page width in points
+        page_height: Page height in points
+
+    Returns:
+        Tuple of (content stream operators, reportlab font names they use)
+
+    Raises:
+        ValueError: If the page dimensions are invalid
+    """
+    # Validate page dimensions
+    if page_width <= 0 or page_height <= 0:
+        raise ValueError(f"Invalid page dimensions: {page_width}x{page_height}")
+
+    # Split the page's chords into parallel columns up front (bboxes, fonts,
+    # sizes, Nashville numbers and their widths), so the draw loop iterates
+    # plain lists instead of chasing annotation attributes per chord
+    bboxes = [annotation.bbox for annotation, _ in page_chords]
+    nashvilles = [nashville for _, nashville in page_chords]
+    font_names = [
+        get_font_mapping(annotation.font_name or "Helvetica")
+        for annotation, _ in page_chords
+    ]
+    font_sizes = [
+        annotation.font_size if annotation.font_size and annotation.font_size > 0 else 12.0
+        for annotation, _ in page_chords
+    ]
+    nashville_widths = estimate_text_widths(nashvilles, font_sizes, font_names)
+
+    # White rectangles over the original chords come first, then all the
+    # Nashville numbers in a single text object
+    rect_ops = ["1 1 1 rg"]  # White
+    text_runs: List[tuple] = []
+
+    for bbox, nashville, font_name, font_size, nashville_width in zip(
+        bboxes, nashvilles, font_names, font_sizes, nashville_widths
+    ):
+        try:
+            # Get chord position with defensive checks
+            if not bbox or len(bbox) != 4:
+                continue  # Skip malformed annotations
+
+            x0, y0, x1, y1 = bbox
+
+            # Validate bbox values
+            if None in (x0, y0, x1, y1):
+                continue  # Skip if any coordinate is None
+
+            # PDF coordinates: origin at bottom-left
+            # pdfplumber coordinates: origin at top-left
+            # Need to convert y-coordinates
+            pdf_y0 = page_height - y1  # Bottom of text box
+            pdf_y1 = page_height - y0  # Top of text box
+
+            # Check if Nashville number will fit in original space
+            original_width = x1 - x0
+            if original_width > 0:
+                # Adjust font size if Nashville number is significantly wider
+                if nashville_width > original_width * 1.2:
+                    font_size = font_size * (original_width / nashville_width) * 0.95
+
+            # Center the text vertically in the original space
+            text_y = pdf_y0 + (pdf_y1 - pdf_y0 - font_size) / 2 + font_size * 0.2
+
+            # Draw white rectangle to cover original chord
+            # Add a bit of padding to ensure complete coverage
+            padding = 2
+            rect_ops.append(
+                f"{_pdf_number(x0 - padding)} {_pdf_number(pdf_y0 - padding)} "
+                f"{_pdf_number((x1 - x0) + 2 * padding)} {_pdf_number((pdf_y1 - pdf_y0) + 2 * padding)} re"
+            )
+
+            text_runs.append((font_name, font_size, x0, text_y, nashville))
+
+        except Exception as chord_error:
+            # Log but continue with other chords - don't fail entire page
+            # In production, we'd log this error
+            continue
+
+    # Fill every rectangle with one operator. They are all wound the same
+    # way, so overlapping ones still fill under the nonzero rule.
+    if len(rect_ops) > 1:
+        rect_ops.append("f")
+
+    # Order the numbers by font and size so the font only has to be set
+    # once per distinct (font, size) rather than whenever it alternates
+    text_runs.sort(key=itemgetter(0, 1))
+    text_ops = ["0 0 0 rg", "BT"]  # Black text
+    fonts: List[str] = []
+    current_font = None
+    # Each number is positioned with Td relative to the previous one (BT
+    # starts at the origin). Offsets are taken between rounded positions so
+    # rounding never accumulates along the page.
+    line_x = line_y = 0.0
+    for font_name, font_size, x, y, nashville in text_runs:
+        if (font_name, font_size) != current_font:
+            if font_name not in fonts:
+                fonts.append(font_name)
+            text_ops.append(f"{OVERLAY_FONT_PREFIX}{font_name} {_pdf_number(font_size)} Tf")
+            current_font = (font_name, font_size)
+        x, y = round(x, 4), round(y, 4)
+        text_ops.append(f"{_pdf_number(x - line_x)} {_pdf_number(y - line_y)} Td {_pdf_string(nashville)} Tj")
+        line_x, line_y = x, y
+    text_ops.append("ET")
+    return "\n".join(rect_ops + text_ops).encode('latin-1') + b"\n", fonts
+
+
 def create_chord_overlay(
     page_chords: List[tuple],
     page_width: float,
@@ -158,95 +371,22 @@ def create_chord_overlay(
     """
     # Lazy import to avoid FUNCTION_INVOCATION_FAILED in serverless environments
     try:
-        from reportlab.pdfgen import canvas
+        from PyPDF2 import PdfWriter
     except ImportError as e:
         raise Exception(
-            "reportlab dependency not available. This feature requires reportlab. "
+            "PyPDF2 dependency not available. This feature requires PyPDF2. "
             f"Import error: {str(e)}"
         )
 
     try:
-        buffer = io.BytesIO()
-
-        # Validate page dimensions
-        if page_width <= 0 or page_height <= 0:
-            raise ValueError(f"Invalid page dimensions: {page_width}x{page_height}")
+        content, fonts = build_overlay_content(page_chords, page_width, page_height)
 
-        # Create canvas with page size
-        c = canvas.Canvas(buffer, pagesize=(page_width, page_height))
-
-        for annotation, nashville in page_chords:
-            try:
-                # Get chord position with defensive checks
-                bbox = annotation.bbox
-                if not bbox or len(bbox) != 4:
-                    continue  # Skip malformed annotations
-
-                x0, y0, x1, y1 = bbox
-
-                # Validate bbox values
-                if None in (x0, y0, x1, y1):
-                    continue  # Skip if any coordinate is None
-
-                # PDF coordinates: origin at bottom-left
-                # pdfplumber coordinates: origin at top-left
-                # Need to convert y-coordinates
-                pdf_y0 = page_height - y1  # Bottom of text box
-                pdf_y1 = page_height - y0  # Top of text box
-
-                # Draw white rectangle to cover original chord
-                c.setFillColorRGB(1, 1, 1)  # White
-                c.setStrokeColorRGB(1, 1, 1)  # White border
-
-                # Add a bit of padding to ensure complete coverage
-                padding = 2
-                c.rect(
-                    x0 - padding,
-                    pdf_y0 - padding,
-                    (x1 - x0) + 2 * padding,
-                    (pdf_y1 - pdf_y0) + 2 * padding,
-                    fill=1,
-                    stroke=0
-                )
-
-                # Map font name to reportlab font
-                font_name = get_font_mapping(annotation.font_name or "Helvetica")
-                font_size = annotation.font_size or 12.0
-
-                # Ensure font size is reasonable
-                if font_size <= 0:
-                    font_size = 12.0
-
-                # Estimate if Nashville number will fit in original space
-                original_width = x1 - x0
-                if original_width > 0:
-                    nashville_width = estimate_text_width(nashville, font_size, font_name)
-
-                    # Adjust font size if Nashville number is significantly wider
-                    if nashville_width > original_width * 1.2:
-                        font_size = font_size * (original_width / nashville_width) * 0.95
-
-                # Draw Nashville number
-                c.setFillColorRGB(0, 0, 0)  # Black text
-                try:
-                    c.setFont(font_name, font_size)
-                except Exception:
-                    # Fallback to Helvetica if font not available
-                    c.setFont('Helvetica', font_size)
-
-                # Center the text vertically in the original space
-                text_y = pdf_y0 + (pdf_y1 - pdf_y0 - font_size) / 2 + font_size * 0.2
-
-                # Draw the Nashville number
-                c.drawString(x0, text_y, nashville)
-
-            except Exception as chord_error:
-                # Log but continue with other chords - don't fail entire page
-                # In production, we'd log this error
-                continue
+        pdf_writer = PdfWriter()
+        page = pdf_writer.add_blank_page(width=page_width, height=page_height)
+        _stamp_overlay(pdf_writer, page, content, fonts, {})
 
-        # Finalize the canvas
-        c.save()
+        buffer = io.BytesIO()
+        pdf_writer.write(buffer)
         buffer.seek(0)
         return buffer
 
@@ -254,6 +394,34 @@ def create_chord_overlay(
         raise Exception(f"Failed to create chord overlay: {str(e)}")
 
 
+def _image_to_jpeg_reader(img, image_readers: Dict[bytes, Any]):
+    """
+    Encode a page image as JPEG once and wrap it in an ImageReader.
+
+    Readers are cached in image_readers by a digest of the raw pixels, so
+    pages that share the same background scan are encoded only once.
+
+    Args:
+        img: PIL image of the page
+        image_readers: Per-document cache of ImageReaders by pixel digest
+
+    Returns:
+        ImageReader over the JPEG-encoded page image
+    """
+    import hashlib
+    from reportlab.lib.utils import ImageReader
+
+    digest = hashlib.sha1(img.tobytes()).digest()
+    reader = image_readers.get(digest)
+    if reader is None:
+        jpeg_buffer = io.BytesIO()
+        img.convert('RGB').save(jpeg_buffer, 'JPEG', quality=85, optimize=False)
+        jpeg_buffer.seek(0)
+        reader = ImageReader(jpeg_buffer)
+        image_readers[digest] = reader
+    return reader
+
+
 def render_scanned_pdf_with_nashville(
     original_pdf_path: str,
     chord_annotations: List[ChordAnnotation],
@@ -291,7 +459,6 @@ def render_scanned_pdf_with_nashville(
 
     try:
         from reportlab.pdfgen import canvas
-        from reportlab.lib.utils import ImageReader
     except ImportError as e:
         raise Exception(
             "reportlab dependency not available. This feature requires reportlab. "
@@ -303,15 +470,13 @@ def render_scanned_pdf_with_nashville(
         images = convert_from_path(original_pdf_path, dpi=150)
 
         # Group chords by page
-        chords_by_page: Dict[int, List[tuple]] = {}
-        for annotation, nashville in zip(chord_annotations, nashville_numbers):
-            page_num = annotation.page_number
-            if page_num not in chords_by_page:
-                chords_by_page[page_num] = []
-            chords_by_page[page_num].append((annotation, nashville))
+        chords_by_page = _group_by_page(chord_annotations, nashville_numbers)
 
-        # Create output PDF (letter size = 612 x 792 points)
-        c = canvas.Canvas(output_path, pagesize=(612, 792))
+        # Create output PDF (letter size = 612 x 792 points). Compress page
+        # streams, and leave out the creation timestamp and random document
+        # ID so identical input renders to identical bytes.
+        c = canvas.Canvas(output_path, pagesize=(612, 792), pageCompression=1, invariant=1)
+        image_readers: Dict[bytes, Any] = {}
 
         for page_num, img in enumerate(images):
             # Get page size
@@ -324,10 +489,13 @@ def render_scanned_pdf_with_nashville(
 
             c.setPageSize((page_width, page_height))
 
-            # Draw image as background
-            # Convert PIL image to ImageReader
-            img_reader = ImageReader(img)
-            c.drawImage(img_reader, 0, 0, width=page_width, height=page_height)
+            # Draw image as background, encoded once per distinct page image
+            img_reader = _image_to_jpeg_reader(img, image_readers)
+            c.drawImage(
+                img_reader, 0, 0,
+                width=page_width, height=page_height,
+                preserveAspectRatio=False
+            )
 
             # Draw Nashville numbers if any on this page
             if page_num in chords_by_page:
@@ -388,10 +556,17 @@ def estimate_render_quality(
     Returns:
         Dictionary with quality metrics
     """
+    # Gather every metric in a single pass over the annotations
+    total_font_size = 0.0
+    pages_with_chords = set()
+    for c in chord_annotations:
+        total_font_size += c.font_size
+        pages_with_chords.add(c.page_number)
+
     return {
         'total_chords': len(chord_annotations),
-        'avg_font_size': sum(c.font_size for c in chord_annotations) / len(chord_annotations) if chord_annotations else 0,
-        'pages_with_chords': len(set(c.page_number for c in chord_annotations)),
+        'avg_font_size': total_font_size / len(chord_annotations) if chord_annotations else 0,
+        'pages_with_chords': len(pages_with_chords),
         'total_pages': metadata.get('num_pages', 0),
-        'coverage': len(set(c.page_number for c in chord_annotations)) / max(metadata.get('num_pages', 1), 1)
+        'coverage': len(pages_with_chords) / max(metadata.get('num_pages', 1), 1)
     }
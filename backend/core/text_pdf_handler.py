@@ -5,17 +5,49 @@ Handles extraction and processing of text-based PDFs using pdfplumber.
 Extracts chords with their bounding box coordinates for precise replacement.
 """
 import io
-from typing import List, Dict, Any, Tuple
+import os
+import sys
+from contextlib import nullcontext
+from functools import lru_cache
+from operator import itemgetter
+from typing import List, Dict, Any, Tuple, Callable, Iterator, Optional, TYPE_CHECKING
 from dataclasses import dataclass
-from backend.core.chord_parser import parse_chord, is_likely_chord, Chord
 
+if TYPE_CHECKING:
+    from backend.core.chord_parser import Chord
 
-@dataclass
+
+ChordMatcher = Callable[[str], Optional["Chord"]]
+
+_chord_matcher: Optional[ChordMatcher] = None
+
+
+def _get_chord_matcher() -> ChordMatcher:
+    """
+    Import chord_parser on first use and return a memoized match_chord.
+
+    pdf_renderer imports this module only for its font helpers, so render-only
+    code paths never load the parser. Lyric sheets repeat the same words and
+    chord symbols many times, so the extraction loop memoizes the chord
+    check. match_chord is pure; cached Chord objects are shared between
+    annotations and must not be mutated.
+    """
+    global _chord_matcher
+    if _chord_matcher is None:
+        from backend.core.chord_parser import match_chord
+        _chord_matcher = lru_cache(maxsize=4096)(match_chord)
+    return _chord_matcher
+
+
+@dataclass(slots=True)
 class ChordAnnotation:
     """
     Represents a chord found in a PDF with its location and properties.
+
+    Declared with slots: a chart can carry thousands of annotations, and the
+    downstream per-annotation loops only read attributes.
     """
-    chord: Chord  # Parsed chord object
+    chord: "Chord"  # Parsed chord object
     text: str  # Original text
     page_number: int  # Page number (0-indexed)
     bbox: Tuple[float, float, float, float]  # (x0, y0, x1, y1) in PDF coordinates
@@ -23,12 +55,400 @@ class ChordAnnotation:
     font_name: str = "Helvetica"  # Font name
 
 
-def extract_chords_from_text_pdf(input_file_bytes: bytes) -> Tuple[List[ChordAnnotation], Dict[str, Any]]:
+# Documents with at least this many pages are extracted in a process pool.
+# pdfplumber's word extraction is pure Python, so threads would serialize on
+# the GIL; below the threshold, worker start-up costs more than it saves.
+PARALLEL_MIN_PAGES = 8
+
+
+def _configured_worker_count() -> int:
+    """
+    Number of processes extraction may use at most, one of them the caller.
+
+    The PDF_EXTRACT_WORKERS environment variable sets it (set it to 1 to
+    always extract serially); by default one worker per CPU this process may
+    run on is used, which respects affinity masks and cpusets where
+    os.sched_getaffinity is available.
+    """
+    try:
+        workers = int(os.environ.get('PDF_EXTRACT_WORKERS', '0'))
+    except ValueError:
+        workers = 0
+    if workers <= 0:
+        if hasattr(os, 'sched_getaffinity'):
+            workers = len(os.sched_getaffinity(0))
+        else:
+            workers = os.cpu_count() or 1
+    return workers
+
+
+def _extract_worker_count(num_pages: int) -> int:
+    """
+    Number of page ranges to split a document into, one per process.
+
+    Capped by _configured_worker_count and by the page count. Short
+    documents are always extracted in-process.
+    """
+    if num_pages < PARALLEL_MIN_PAGES:
+        return 1
+    return min(_configured_worker_count(), num_pages)
+
+
+# Coarse word filter applied before the chord checks; mirrors the length and
+# first-letter heuristics in chord_parser.match_chord
+MAX_CHORD_LENGTH = 10
+CHORD_ROOT_LETTERS = frozenset('ABCDEFG')
+
+_word_bbox = itemgetter('x0', 'top', 'x1', 'bottom')
+
+
+def _iter_layout_chars(objs):
+    """Yield the LTChar leaves of a pdfminer layout tree in document order."""
+    from pdfminer.layout import LTChar, LTContainer
+
+    for obj in objs:
+        if isinstance(obj, LTChar):
+            yield obj
+        elif isinstance(obj, LTContainer):
+            yield from _iter_layout_chars(obj._objs)
+
+
+def _extract_page_words(page) -> List[Dict[str, Any]]:
+    """
+    Extract a page's words as page.extract_words() would, but faster.
+
+    pdfplumber builds a full attribute dict for every character on the page,
+    resolving colours, matrices and marked-content tags, before grouping
+    them into words; that is most of the extraction time and only the
+    position and text are needed. _extract_layout_words reads the pdfminer
+    layout directly instead. Pages whose chars are already parsed (e.g. by
+    detection) and non-default pdfplumber setups use page.extract_words()
+    unchanged, as does any page the fast path cannot read.
+    """
+    if hasattr(page, '_objects'):
+        return page.extract_words()
+
+    try:
+        if page.pdf.unicode_norm is None:
+            return _extract_layout_words(page)
+    except AttributeError:
+        # The fast path reads private pdfplumber/pdfminer attributes (see the
+        # pin in requirements.txt); if they have changed, use the public API
+        pass
+    return page.extract_words()
+
+
+def _extract_layout_words(page) -> List[Dict[str, Any]]:
+    """
+    Build minimal char dicts with the keys pdfplumber's WordExtractor uses
+    from the page's pdfminer layout, and run the same word grouping on them.
+
+    Relies on pdfplumber and pdfminer internals (page.layout._objs,
+    LTContainer._objs, page.initial_doctop); raises AttributeError if they
+    are missing.
+    """
+    # Lazy import to avoid FUNCTION_INVOCATION_FAILED in serverless environments
+    from pdfplumber.utils.text import WordExtractor
+
+    # Same coordinate flip and MediaBox offsets as pdfplumber's Page.process_object
+    height = page.height
+    mb_x0, mb_top = page.mediabox[:2]
+    doctop_offset = page.initial_doctop
+
+    chars = []
+    for obj in _iter_layout_chars(page.layout._objs):
+        top = (height - obj.y1) + mb_top
+        chars.append({
+            'text': obj.get_text(),
+            'upright': obj.upright,
+            'x0': obj.x0 + mb_x0,
+            'x1': obj.x1 + mb_x0,
+            'top': top,
+            'bottom': (height - obj.y0) + mb_top,
+            'doctop': doctop_offset + top,
+        })
+
+    return WordExtractor().extract_words(chars)
+
+
+def _is_chord_candidate(word: Dict[str, Any]) -> bool:
+    """Return True if a word is short and starts with a note letter."""
+    text = word.get('text') or ''
+    return 0 < len(text) <= MAX_CHORD_LENGTH and text[0] in CHORD_ROOT_LETTERS
+
+
+def _extract_page_chords(page, page_num: int, page_sizes: List[Dict[str, float]]) -> List[ChordAnnotation]:
+    """
+    Extract chord annotations from a single pdfplumber page.
+
+    The page size is appended to page_sizes. Problematic words are skipped;
+    errors reading the page itself propagate to the caller.
+    """
+    chords = []
+    match_chord = _get_chord_matcher()
+
+    # Store page size with fallbacks
+    page_width = getattr(page, 'width', 612) or 612
+    page_height = getattr(page, 'height', 792) or 792
+    page_sizes.append({
+        'width': page_width,
+        'height': page_height
+    })
+
+    # Extract words with bounding boxes
+    words = _extract_page_words(page) or []
+
+    # Coarse prefilter in one pass: only short words starting with a note
+    # letter can be chords, so lyrics never reach the per-word checks below
+    words = [word for word in words if _is_chord_candidate(word)]
+
+    for word in words:
+        try:
+            text = word['text']
+
+            # Check if this word is likely a chord and parse it
+            chord = match_chord(text)
+            if not chord:
+                continue
+
+            # pdfplumber uses (x0, top, x1, bottom) format and already
+            # reports coordinates as floats; a missing key skips the word
+            bbox = _word_bbox(word)
+            if None in bbox:
+                continue
+
+            # Try to extract font information with defaults
+            font_size = word.get('height')
+            if not isinstance(font_size, (int, float)) or font_size <= 0:
+                font_size = 12.0
+            font_name = word.get('fontname') or 'Helvetica'
+
+            # Chord sheets repeat a few symbols thousands of times; interning
+            # lets every annotation of a chord share one string, like the
+            # memoized Chord objects, instead of keeping one per word
+            annotation = ChordAnnotation(
+                chord=chord,
+                text=sys.intern(text),
+                page_number=page_num,
+                bbox=bbox,
+                font_size=font_size,
+                font_name=font_name
+            )
+
+            chords.append(annotation)
+
+        except Exception:
+            # Skip problematic words, continue with others
+            continue
+
+    return chords
+
+
+def _extract_page_range(
+    pdf,
+    start: int,
+    stop: int
+) -> Tuple[List[ChordAnnotation], List[Dict[str, float]]]:
+    """
+    Extract chords from pages [start, stop) of an open pdfplumber document.
+
+    Returns:
+        Tuple of (chord annotations, page sizes) for the range
+    """
+    chords = []
+    page_sizes = []
+
+    for page_num in range(start, stop):
+        try:
+            chords.extend(_extract_page_chords(pdf.pages[page_num], page_num, page_sizes))
+        except Exception:
+            # Skip problematic pages, continue with others
+            continue
+
+    return chords, page_sizes
+
+
+def iter_text_pdf_chords(pdf) -> Iterator[ChordAnnotation]:
+    """
+    Lazily yield chord annotations from an open document, page by page.
+
+    Pages are only parsed as the caller consumes chords, so taking the first
+    few (e.g. with itertools.islice) stops after the pages that hold them.
+    Problematic pages are skipped, as in extract_chords_from_text_pdf.
+
+    Args:
+        pdf: Open pdfplumber document (see open_text_pdf)
+
+    Yields:
+        ChordAnnotations in page order
+    """
+    page_sizes = []
+    for page_num in range(len(pdf.pages)):
+        try:
+            page_chords = _extract_page_chords(pdf.pages[page_num], page_num, page_sizes)
+        except Exception:
+            continue
+        yield from page_chords
+
+
+def _extract_page_range_from_bytes(
+    input_file_bytes: bytes,
+    start: int,
+    stop: int
+) -> Tuple[List[ChordAnnotation], List[Dict[str, float]]]:
+    """Process-pool worker: open the PDF and extract one range of pages."""
+    import pdfplumber
+
+    with pdfplumber.open(io.BytesIO(input_file_bytes)) as pdf:
+        return _extract_page_range(pdf, start, stop)
+
+
+# Worker processes are kept between requests so each long document does
+# not pay for starting a pool; created on first use
+_extract_pool = None
+_extract_pool_size = 0
+
+
+def _get_extract_pool():
+    """
+    Return the shared extraction pool, starting it on first use.
+
+    The pool is sized once from the configured worker count, less the
+    calling process; shorter documents just use fewer of its workers.
+    """
+    global _extract_pool, _extract_pool_size
+    from concurrent.futures import ProcessPoolExecutor
+
+    if _extract_pool is None:
+        _extract_pool_size = max(_configured_worker_count() - 1, 1)
+        _extract_pool = ProcessPoolExecutor(max_workers=_extract_pool_size)
+    return _extract_pool
+
+
+def _discard_extract_pool() -> None:
+    """Shut down the shared extraction pool so the next use starts a new one."""
+    global _extract_pool, _extract_pool_size
+    if _extract_pool is not None:
+        _extract_pool.shutdown(wait=False, cancel_futures=True)
+    _extract_pool = None
+    _extract_pool_size = 0
+
+
+def _extract_pages_in_parallel(
+    pdf,
+    input_file_bytes: bytes,
+    num_pages: int,
+    workers: int
+) -> Tuple[List[ChordAnnotation], List[Dict[str, float]]]:
+    """
+    Split the document into one contiguous page range per worker and extract
+    them concurrently. Results are concatenated in page order.
+
+    The calling process is one of the workers: it extracts the first range
+    from the already open document while the shared pool handles the
+    rest, instead of sitting idle until the pool finishes. workers is at
+    most the configured worker count, so the pool has a process free for
+    every other range. A pool that fails is discarded and the error re-raised.
+    """
+    bounds = [num_pages * i // workers for i in range(workers + 1)]
+    ranges = list(zip(bounds, bounds[1:]))
+
+    executor = _get_extract_pool()
+    try:
+        futures = [
+            executor.submit(_extract_page_range_from_bytes, input_file_bytes, start, stop)
+            for start, stop in ranges[1:]
+        ]
+        chords, page_sizes = _extract_page_range(pdf, *ranges[0])
+        for future in futures:
+            range_chords, range_sizes = future.result()
+            chords.extend(range_chords)
+            page_sizes.extend(range_sizes)
+    except Exception:
+        _discard_extract_pool()
+        raise
+
+    return chords, page_sizes
+
+
+# Documents shorter than this are not sampled before full extraction; the
+# sample would cover most of the document anyway
+SAMPLE_MIN_PAGES = 3
+
+
+def sample_rules_out_chords(pdf) -> bool:
+    """
+    Check the first and last pages of an open document for chord candidates.
+
+    A sheet with chords on its middle pages often opens with a title or
+    lyrics page and closes with credits, so pages without chords prove
+    nothing. Only pages that carry text but not a single short word starting
+    with a note letter (A-G) make a chord sheet unlikely. The sampled pages
+    stay cached on the pdfplumber document, so a following full extraction
+    does not lay them out again.
+
+    Args:
+        pdf: Open pdfplumber document (see open_text_pdf)
+
+    Returns:
+        True if the document has at least SAMPLE_MIN_PAGES pages and both
+        its first and last pages have text without any chord candidate; False
+        if the document has to be fully extracted to tell
+    """
+    num_pages = len(pdf.pages)
+    if num_pages < SAMPLE_MIN_PAGES:
+        return False
+
+    for page_num in (0, num_pages - 1):
+        try:
+            words = _extract_page_words(pdf.pages[page_num])
+        except Exception:
+            return False
+        # Pages without text (e.g. an image cover) are no evidence either way
+        if not words or any(_is_chord_candidate(word) for word in words):
+            return False
+
+    return True
+
+
+def open_text_pdf(input_file_bytes: bytes):
+    """
+    Open a PDF with pdfplumber so several stages can share one parse.
+
+    Pass the result to detect_if_text_pdf and extract_chords_from_text_pdf;
+    the caller is responsible for closing it.
+
+    Args:
+        input_file_bytes: Raw bytes of the PDF file
+
+    Returns:
+        An open pdfplumber PDF, or None if pdfplumber is unavailable or the
+        file cannot be opened
+    """
+    # Lazy import to avoid FUNCTION_INVOCATION_FAILED in serverless environments
+    try:
+        import pdfplumber
+        return pdfplumber.open(io.BytesIO(input_file_bytes))
+    except Exception:
+        return None
+
+
+def extract_chords_from_text_pdf(
+    input_file_bytes: bytes,
+    pdf=None
+) -> Tuple[List[ChordAnnotation], Dict[str, Any]]:
     """
     Extract chords with positions from a text-based PDF.
 
+    Long documents (see PARALLEL_MIN_PAGES and PDF_EXTRACT_WORKERS) are split
+    across a process pool; if worker processes are unavailable, as on some
+    serverless platforms, the pages are extracted serially instead.
+
     Args:
-        pdf_path: Path to the PDF file
+        input_file_bytes: Raw bytes of the PDF file
+        pdf: Optional pdfplumber document already opened on input_file_bytes
+            (see open_text_pdf). It is reused instead of parsing the file
+            again, and left open for the caller to close.
 
     Returns:
         Tuple of (list of ChordAnnotations, PDF metadata)
@@ -49,84 +469,35 @@ def extract_chords_from_text_pdf(input_file_bytes: bytes) -> Tuple[List[ChordAnn
     metadata = {}
 
     try:
-        with pdfplumber.open(io.BytesIO(input_file_bytes)) as pdf:
+        if pdf is not None:
+            pdf_context = nullcontext(pdf)
+        else:
+            pdf_context = pdfplumber.open(io.BytesIO(input_file_bytes))
+
+        with pdf_context as pdf:
+            num_pages = len(pdf.pages)
+
             # Extract PDF metadata
             metadata = {
-                'num_pages': len(pdf.pages),
+                'num_pages': num_pages,
                 'page_sizes': []
             }
 
-            for page_num, page in enumerate(pdf.pages):
+            parallel_result = None
+            workers = _extract_worker_count(num_pages)
+            if workers > 1:
                 try:
-                    # Store page size with fallbacks
-                    page_width = getattr(page, 'width', 612) or 612
-                    page_height = getattr(page, 'height', 792) or 792
-                    metadata['page_sizes'].append({
-                        'width': page_width,
-                        'height': page_height
-                    })
-
-                    # Extract words with bounding boxes
-                    words = page.extract_words() or []
-
-                    for word in words:
-                        try:
-                            text = word.get('text', '')
-                            if not text:
-                                continue
-
-                            # Check if this word is likely a chord
-                            if not is_likely_chord(text):
-                                continue
-
-                            # Parse the chord
-                            chord = parse_chord(text)
-                            if not chord:
-                                continue
-
-                            # Extract bounding box coordinates with defensive checks
-                            # pdfplumber uses (x0, top, x1, bottom) format
-                            x0 = word.get('x0')
-                            top = word.get('top')
-                            x1 = word.get('x1')
-                            bottom = word.get('bottom')
-
-                            # Skip if any coordinate is missing
-                            if None in (x0, top, x1, bottom):
-                                continue
-
-                            bbox = (x0, top, x1, bottom)
-
-                            # Try to extract font information with defaults
-                            font_size = word.get('height') or word.get('size') or 12.0
-                            font_name = word.get('fontname') or 'Helvetica'
-
-                            # Ensure font_size is a valid number
-                            try:
-                                font_size = float(font_size)
-                                if font_size <= 0:
-                                    font_size = 12.0
-                            except (TypeError, ValueError):
-                                font_size = 12.0
-
-                            annotation = ChordAnnotation(
-                                chord=chord,
-                                text=text,
-                                page_number=page_num,
-                                bbox=bbox,
-                                font_size=font_size,
-                                font_name=font_name
-                            )
-
-                            chords.append(annotation)
-
-                        except Exception:
-                            # Skip problematic words, continue with others
-                            continue
-
-                except Exception:
-                    # Skip problematic pages, continue with others
-                    continue
+                    parallel_result = _extract_pages_in_parallel(
+                        pdf, input_file_bytes, num_pages, workers
+                    )
+                except (OSError, NotImplementedError, RuntimeError):
+                    # No usable process pool here; fall back to the serial loop
+                    parallel_result = None
+
+            if parallel_result is None:
+                parallel_result = _extract_page_range(pdf, 0, num_pages)
+
+            chords, metadata['page_sizes'] = parallel_result
 
     except Exception as e:
         error_msg = str(e)
@@ -140,48 +511,117 @@ def extract_chords_from_text_pdf(input_file_bytes: bytes) -> Tuple[List[ChordAnn
     return chords, metadata
 
 
-def detect_if_text_pdf(input_file_bytes: bytes, min_text_threshold: int = 50) -> bool:
+def _may_contain_fonts(input_file_bytes: bytes) -> bool:
     """
-    Detect if a PDF is text-based (as opposed to scanned/image-based).
+    Return False only when the raw PDF bytes prove there are no fonts.
 
-    Args:
+    Page resource dictionaries are stored uncompressed unless the file uses
+    object streams (/ObjStm), so without object streams a missing /Font key
+    means no page can carry text.
+    """
+    if b'/Font' in input_file_bytes:
+        return True
+    return b'/ObjStm' in input_file_bytes
 
-        min_text_threshold: Minimum number of characters to consider it text-based
 
-    Returns:
-        True if the PDF appears to be text-based, False otherwise
+def _first_page_text_pdfium(input_file_bytes: bytes, pypdfium2) -> Optional[str]:
+    """
+    Extract the first page's text with PDFium's C text API.
+
+    Returns None if the document has no pages.
+    """
+    pdf = pypdfium2.PdfDocument(input_file_bytes)
+    try:
+        if len(pdf) == 0:
+            return None
+        page = pdf[0]
+        textpage = page.get_textpage()
+        try:
+            return textpage.get_text_range()
+        finally:
+            textpage.close()
+            page.close()
+    finally:
+        pdf.close()
+
+
+def _first_page_text_pdfplumber(input_file_bytes: bytes, pdfplumber) -> Optional[str]:
+    """
+    Extract the first page's text with pdfplumber.
+
+    Returns None if the document has no pages.
+    """
+    with pdfplumber.open(io.BytesIO(input_file_bytes)) as pdf:
+        if not pdf.pages:
+            return None
+        return pdf.pages[0].extract_text()
+
+
+def _first_page_text(input_file_bytes: bytes) -> Optional[str]:
+    """
+    Extract the first page's text, preferring pypdfium2 over pdfplumber.
+
+    Raises:
+        ImportError: If neither PDF library is installed
     """
     # Lazy import to avoid FUNCTION_INVOCATION_FAILED in serverless environments
     try:
-        import pdfplumber
+        import pypdfium2
     except ImportError:
-        # If pdfplumber is not available, assume it's not a text PDF
-        return False
+        import pdfplumber
+        return _first_page_text_pdfplumber(input_file_bytes, pdfplumber)
+    return _first_page_text_pdfium(input_file_bytes, pypdfium2)
 
-    try:
-        with pdfplumber.open(io.BytesIO(input_file_bytes)) as pdf:
-            # Check first page
-            if not pdf.pages:
-                return False
 
-            first_page = pdf.pages[0]
-            text = first_page.extract_text()
+def detect_if_text_pdf(input_file_bytes: bytes, min_text_threshold: int = 50, pdf=None) -> bool:
+    """
+    Detect if a PDF is text-based (as opposed to scanned/image-based).
+
+    Image-only files are rejected from a scan of the raw bytes before the
+    PDF is parsed. Otherwise the first page's text is read with pypdfium2,
+    which only loads that page and extracts text in C; pdfplumber is used
+    as a fallback when pypdfium2 is not installed.
+
+    When an open pdfplumber document is passed, its first page is used
+    instead: pdfplumber caches the parsed page, so a following
+    extract_chords_from_text_pdf call on the same document reuses the work.
 
-            # If we can extract meaningful text, it's text-based
-            if text and len(text.strip()) >= min_text_threshold:
-                return True
+    Args:
+        input_file_bytes: Raw bytes of the PDF file
+        min_text_threshold: Minimum number of characters to consider it text-based
+        pdf: Optional pdfplumber document already opened on input_file_bytes
 
+    Returns:
+        True if the PDF appears to be text-based, False otherwise
+    """
+    try:
+        # Cheap pre-check on the raw bytes: a PDF with no font resources
+        # cannot contain extractable text. Fonts may be hidden inside
+        # compressed object streams, so only trust the check when the file
+        # has none.
+        if not _may_contain_fonts(input_file_bytes):
             return False
 
+        if pdf is not None:
+            text = pdf.pages[0].extract_text() if pdf.pages else None
+        else:
+            text = _first_page_text(input_file_bytes)
     except Exception:
-        # If we can't extract text, assume it's not text-based
+        # If no parser is available or we can't extract text,
+        # assume it's not text-based
         return False
 
+    # If we can extract meaningful text, it's text-based
+    return bool(text) and len(text.strip()) >= min_text_threshold
 
+
+@lru_cache(maxsize=128)
 def get_font_mapping(font_name: str) -> str:
     """
     Map PDF font names to reportlab-compatible font names.
 
+    Cached: a chart uses a handful of fonts, so nearly every call repeats.
+
     Args:
         font_name: Font name from PDF
 
@@ -212,34 +652,74 @@ def get_font_mapping(font_name: str) -> str:
     return 'Helvetica'
 
 
+def _get_string_width() -> Callable[[str, str, float], float]:
+    """
+    Get reportlab's stringWidth, which measures text with the AFM metrics of
+    the standard PDF fonts.
+
+    Raises:
+        Exception: If reportlab is unavailable
+    """
+    # Lazy import to avoid FUNCTION_INVOCATION_FAILED in serverless environments
+    try:
+        from reportlab.pdfbase.pdfmetrics import stringWidth
+    except ImportError as e:
+        raise Exception(
+            "reportlab dependency not available. This feature requires reportlab. "
+            f"Import error: {str(e)}"
+        )
+    return stringWidth
+
+
 def estimate_text_width(text: str, font_size: float, font_name: str = "Helvetica") -> float:
     """
-    Estimate the width of text in PDF units.
+    Measure the width of text in PDF units.
 
-    This is a rough approximation since exact width depends on the font metrics.
+    Uses the metrics of the reportlab font the text will be drawn with, so
+    the result matches what the overlay renders.
 
     Args:
         text: Text to measure
         font_size: Font size in points
-        font_name: Font name
+        font_name: Font name (mapped with get_font_mapping)
 
     Returns:
-        Estimated width in PDF units (points)
+        Width in PDF units (points)
+
+    Raises:
+        Exception: If reportlab is unavailable
+    """
+    string_width = _get_string_width()
+    return string_width(text, get_font_mapping(font_name), font_size)
+
+
+def estimate_text_widths(
+    texts: List[str],
+    font_sizes: List[float],
+    font_names: List[str]
+) -> List[float]:
     """
-    # Average character width as a fraction of font size
-    # These are approximate values
-    char_width_ratios = {
-        'Helvetica': 0.55,
-        'Helvetica-Bold': 0.58,
-        'Times-Roman': 0.50,
-        'Courier': 0.60,  # Monospace
-    }
+    Measure the widths of many strings in one pass.
 
-    # Get the base font family
-    base_font = font_name.split('-')[0] if '-' in font_name else font_name
-    ratio = char_width_ratios.get(base_font, 0.55)
+    Batch form of estimate_text_width for callers that measure every chord
+    on a page up front.
 
-    return len(text) * font_size * ratio
+    Args:
+        texts: Texts to measure
+        font_sizes: Font size in points for each text
+        font_names: Font name for each text
+
+    Returns:
+        Widths in PDF units (points), parallel to texts
+
+    Raises:
+        Exception: If reportlab is unavailable
+    """
+    string_width = _get_string_width()
+    return [
+        string_width(text, get_font_mapping(font_name), font_size)
+        for text, font_size, font_name in zip(texts, font_sizes, font_names)
+    ]
 
 
 def group_chords_by_proximity(chords: List[ChordAnnotation], threshold: float = 30.0) -> List[List[ChordAnnotation]]:
@@ -278,8 +758,7 @@ def group_chords_by_proximity(chords: List[ChordAnnotation], threshold: float =
             current_group = [chord]
 
     # Add the last group
-    if current_group:
-        groups.append(current_group)
+    groups.append(current_group)
 
     return groups
 
@@ -299,24 +778,7 @@ def filter_false_positives(chords: List[ChordAnnotation]) -> List[ChordAnnotatio
     Returns:
         Filtered list of chord annotations
     """
-    filtered = []
-
-    for chord in chords:
-        # Skip very large text (likely titles/headings)
-        if chord.font_size > 24:
-            continue
-
-        # Skip very small text (likely footnotes)
-        if chord.font_size < 8:
-            continue
-
-        # Single letter chords ('A', 'C', etc.) are risky
-        # Keep them only if they match common chord patterns
-        if len(chord.text) <= 1:
-            # Could be 'A' chord or just letter 'A' in text
-            # Keep it for now, but mark as potentially ambiguous
-            pass
-
-        filtered.append(chord)
-
-    return filtered
+    # Skip very large text (likely titles/headings) and very small text
+    # (likely footnotes). Single-letter chords ('A', 'C', etc.) are risky
+    # but kept for now, since they could be an 'A' chord or the word 'A'.
+    return [chord for chord in chords if 8 <= chord.font_size <= 24]
@@ -0,0 +1,22 @@
+"""
+Shared test helpers
+
+Builds small in-memory PDFs for the text extraction, processing, rendering
+and API tests.
+"""
+
+import io
+
+
+def make_pdf(page_lines):
+    """Build an in-memory PDF with one page per list of text lines."""
+    from reportlab.pdfgen import canvas
+
+    buffer = io.BytesIO()
+    c = canvas.Canvas(buffer)
+    for lines in page_lines:
+        for i, line in enumerate(lines):
+            c.drawString(72, 720 - i * 20, line)
+        c.showPage()
+    c.save()
+    return buffer.getvalue()
@@ -47,72 +47,41 @@ def create_simple_chord_chart(output_path: Path):
     c.drawString(1 * inch, y_pos, "Verse:")
 
     y_pos -= 0.3 * inch
-    c.setFont("Helvetica", 12)
 
-    # Line 1: "Amazing grace how sweet the sound"
-    chords_line1 = [
-        ("G", 1 * inch),
-        ("G7", 3 * inch),
-        ("C", 5 * inch),
+    # (chords with x positions, lyrics, gap above the line)
+    lines = [
+        # Line 1: "Amazing grace how sweet the sound"
+        ([("G", 1 * inch), ("G7", 3 * inch), ("C", 5 * inch)],
+         "Amazing grace how sweet the sound", 0),
+        # Line 2: "That saved a wretch like me"
+        ([("G", 1 * inch), ("Em", 2.5 * inch), ("D", 4 * inch), ("D7", 5.5 * inch)],
+         "That saved a wretch like me", 0.8 * inch),
+        # Line 3: "I once was lost but now I'm found"
+        ([("G", 1 * inch), ("G7", 2.5 * inch), ("C", 4 * inch), ("G", 5.5 * inch)],
+         "I once was lost but now I'm found", 0.8 * inch),
+        # Line 4: "Was blind but now I see"
+        ([("Em", 1 * inch), ("D", 2.5 * inch), ("G", 4 * inch)],
+         "Was blind but now I see", 0.8 * inch),
     ]
 
-    lyrics_y = y_pos - 0.2 * inch
-    c.setFont("Helvetica-Bold", 14)
-    for chord, x in chords_line1:
-        c.drawString(x, y_pos, chord)
-
-    c.setFont("Helvetica", 12)
-    c.drawString(1 * inch, lyrics_y, "Amazing grace how sweet the sound")
-
-    # Line 2: "That saved a wretch like me"
-    y_pos -= 0.8 * inch
-    chords_line2 = [
-        ("G", 1 * inch),
-        ("Em", 2.5 * inch),
-        ("D", 4 * inch),
-        ("D7", 5.5 * inch),
-    ]
-
-    lyrics_y = y_pos - 0.2 * inch
-    c.setFont("Helvetica-Bold", 14)
-    for chord, x in chords_line2:
-        c.drawString(x, y_pos, chord)
-
-    c.setFont("Helvetica", 12)
-    c.drawString(1 * inch, lyrics_y, "That saved a wretch like me")
-
-    # Line 3: "I once was lost but now I'm found"
-    y_pos -= 0.8 * inch
-    chords_line3 = [
-        ("G", 1 * inch),
-        ("G7", 2.5 * inch),
-        ("C", 4 * inch),
-        ("G", 5.5 * inch),
-    ]
-
-    lyrics_y = y_pos - 0.2 * inch
-    c.setFont("Helvetica-Bold", 14)
-    for chord, x in chords_line3:
-        c.drawString(x, y_pos, chord)
-
-    c.setFont("Helvetica", 12)
-    c.drawString(1 * inch, lyrics_y, "I once was lost but now I'm found")
-
-    # Line 4: "Was blind but now I see"
-    y_pos -= 0.8 * inch
-    chords_line4 = [
-        ("Em", 1 * inch),
-        ("D", 2.5 * inch),
-        ("G", 4 * inch),
-    ]
-
-    lyrics_y = y_pos - 0.2 * inch
-    c.setFont("Helvetica-Bold", 14)
-    for chord, x in chords_line4:
-        c.drawString(x, y_pos, chord)
-
-    c.setFont("Helvetica", 12)
-    c.drawString(1 * inch, lyrics_y, "Was blind but now I see")
+    # Draw every chord row in one bold text object and every lyric line in
+    # one regular text object, so the font is set once per pass instead of
+    # twice per line
+    chord_text = c.beginText()
+    chord_text.setFont("Helvetica-Bold", 14)
+    lyric_text = c.beginText()
+    lyric_text.setFont("Helvetica", 12)
+
+    for chords, lyrics, gap in lines:
+        y_pos -= gap
+        for chord, x in chords:
+            chord_text.setTextOrigin(x, y_pos)
+            chord_text.textOut(chord)
+        lyric_text.setTextOrigin(1 * inch, y_pos - 0.2 * inch)
+        lyric_text.textOut(lyrics)
+
+    c.drawText(chord_text)
+    c.drawText(lyric_text)
 
     # Chorus
     y_pos -= 1.2 * inch
@@ -130,13 +99,15 @@ def create_simple_chord_chart(output_path: Path):
         ("D", 7 * inch),
     ]
 
-    lyrics_y = y_pos - 0.2 * inch
-    c.setFont("Helvetica-Bold", 14)
+    chord_text = c.beginText()
+    chord_text.setFont("Helvetica-Bold", 14)
     for chord, x in chords_chorus:
-        c.drawString(x, y_pos, chord)
+        chord_text.setTextOrigin(x, y_pos)
+        chord_text.textOut(chord)
+    c.drawText(chord_text)
 
     c.setFont("Helvetica", 12)
-    c.drawString(1 * inch, lyrics_y, "Grace, grace, God's grace")
+    c.drawString(1 * inch, y_pos - 0.2 * inch, "Grace, grace, God's grace")
 
     # Footer
     c.setFont("Helvetica-Oblique", 8)
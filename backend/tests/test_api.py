@@ -0,0 +1,116 @@
+"""
+Unit tests for the API upload checks
+
+Tests the size and PDF header checks on /convert and /validate.
+"""
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("httpx")  # Required by fastapi.testclient
+
+from fastapi import HTTPException  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+
+from backend.api.main import (  # noqa: E402
+    MAX_FILE_SIZE,
+    PDF_HEADER_SEARCH_BYTES,
+    app,
+    validate_pdf_contents
+)
+from backend.tests.conftest import make_pdf  # noqa: E402
+
+OVERSIZED_PDF = b"%PDF-1.4\n" + b"0" * MAX_FILE_SIZE
+NOT_A_PDF = b"PK\x03\x04 this is a zip archive, not a PDF"
+
+
+@pytest.fixture(scope="module")
+def client():
+    """Provide a test client for the API app."""
+    return TestClient(app)
+
+
+def upload(data):
+    """Build the multipart file field for an upload named chart.pdf."""
+    return {"file": ("chart.pdf", data, "application/pdf")}
+
+
+class TestValidatePdfContents:
+    """Test the raw-bytes checks shared by the upload endpoints."""
+
+    def test_accepts_pdf_header(self):
+        """Test that a header within the search window is accepted."""
+        validate_pdf_contents(b"%PDF-1.7\n")
+        validate_pdf_contents(b"\x00" * (PDF_HEADER_SEARCH_BYTES - 10) + b"%PDF-1.7\n")
+
+    def test_rejects_missing_header(self):
+        """Test that a header past the search window is not found."""
+        with pytest.raises(HTTPException) as excinfo:
+            validate_pdf_contents(b"\x00" * PDF_HEADER_SEARCH_BYTES + b"%PDF-1.7\n")
+        assert excinfo.value.status_code == 400
+
+    def test_rejects_oversized_file(self):
+        """Test that files over MAX_FILE_SIZE are rejected first."""
+        with pytest.raises(HTTPException) as excinfo:
+            validate_pdf_contents(OVERSIZED_PDF)
+        assert excinfo.value.status_code == 413
+
+
+class TestConvertUploadChecks:
+    """Test that /convert rejects bad uploads before parsing them."""
+
+    def test_oversized_upload(self, client):
+        """Test that an oversized upload gets a 413."""
+        response = client.post("/convert", files=upload(OVERSIZED_PDF), data={"key": "C"})
+
+        assert response.status_code == 413
+        assert response.json()["detail"]["step"] == "file_upload"
+
+    def test_missing_pdf_header(self, client):
+        """Test that an upload without a PDF header gets a 400."""
+        response = client.post("/convert", files=upload(NOT_A_PDF), data={"key": "C"})
+
+        assert response.status_code == 400
+        assert response.json()["detail"]["step"] == "file_upload"
+
+
+class TestValidateUploadChecks:
+    """Test the upload checks on /validate."""
+
+    def test_oversized_upload(self, client):
+        """Test that an oversized upload gets a 413."""
+        response = client.post("/validate", files=upload(OVERSIZED_PDF))
+
+        assert response.status_code == 413
+        assert response.json()["detail"]["step"] == "file_upload"
+
+    def test_missing_pdf_header_is_reported_invalid(self, client):
+        """Test that a file without a PDF header is reported, not rejected."""
+        response = client.post("/validate", files=upload(NOT_A_PDF))
+
+        assert response.status_code == 200
+        assert response.json()["valid"] is False
+
+    def test_failed_read_reports_error_details(self, client, monkeypatch):
+        """Test that a failed read gets the full 500 error body."""
+        from starlette.datastructures import UploadFile
+
+        async def failing_read(self, size=-1):
+            raise OSError("connection reset")
+
+        monkeypatch.setattr(UploadFile, "read", failing_read)
+        response = client.post("/convert", files=upload(b"%PDF-1.4\n"), data={"key": "C"})
+
+        assert response.status_code == 500
+        detail = response.json()["detail"]
+        assert detail["step"] == "file_upload"
+        assert detail["error_type"] == "OSError"
+        assert "trace_id" in detail and "traceback" in detail
+
+    def test_processing_error_keeps_its_status(self, client):
+        """Test that a chart without chords gets the 400 processing error."""
+        lyrics = ["la " * 20, "hmm " * 15]
+        response = client.post("/convert", files=upload(make_pdf([lyrics] * 3)), data={"key": "C"})
+
+        assert response.status_code == 400
+        assert response.json()["detail"]["processing_error"] is True
@@ -7,6 +7,7 @@ Tests chord recognition, parsing, and validation logic.
 from backend.core.chord_parser import (
     parse_chord,
     is_likely_chord,
+    match_chord,
     extract_chords_from_text,
     normalize_enharmonic,
     get_chord_info
@@ -205,6 +206,23 @@ class TestIsLikelyChord:
         assert is_likely_chord("") is False
 
 
+class TestMatchChord:
+    """Test the combined likelihood check and parse."""
+
+    def test_returns_parsed_chord(self):
+        """Test that likely chords come back parsed."""
+        chord = match_chord(" D/F# ")
+        assert chord is not None
+        assert chord.root == "D"
+        assert chord.bass == "F#"
+
+    def test_agrees_with_separate_checks(self):
+        """Test that the result matches is_likely_chord followed by parse_chord."""
+        for text in ["C", "Am", "Gmaj7", "Bb/D", "And", "Come", "Hallelujah", "hello", ""]:
+            expected = parse_chord(text) if is_likely_chord(text) else None
+            assert match_chord(text) == expected
+
+
 class TestExtractChordsFromText:
     """Test extracting multiple chords from text."""
 
@@ -245,6 +263,11 @@ class TestExtractChordsFromText:
         chords = extract_chords_from_text(text)
         assert len(chords) == 4
 
+    def test_extract_with_leading_punctuation(self):
+        """Test that punctuation before a chord is stripped too."""
+        chords = extract_chords_from_text("(Am) ..G7 x(C)")
+        assert [c.original for c in chords] == ["Am", "G7"]
+
     def test_empty_text(self):
         """Test extracting from empty text."""
         chords = extract_chords_from_text("")
@@ -13,6 +13,8 @@ from backend.core.nashville_converter import (
     format_scale_degree,
     convert_chord_to_nashville,
     convert_text_to_nashville,
+    convert_many_to_nashville,
+    make_converter,
     get_key_signature_preference,
     validate_key,
     detect_mode_from_chords
@@ -189,34 +191,46 @@ class TestFormatScaleDegree:
 class TestConvertChordToNashville:
     """Test complete chord to Nashville conversion."""
 
-    def test_c_major_basic_chords(self):
+    # I - IV - V - I progression
+    @pytest.mark.parametrize("text,expected", [
+        ("C", "1"),
+        ("F", "4"),
+        ("G", "5"),
+    ])
+    def test_c_major_basic_chords(self, text, expected):
         """Test basic chords in C major."""
-        # I - IV - V - I progression
-        assert convert_chord_to_nashville(parse_chord("C"), "C", "major") == "1"
-        assert convert_chord_to_nashville(parse_chord("F"), "C", "major") == "4"
-        assert convert_chord_to_nashville(parse_chord("G"), "C", "major") == "5"
-
-    def test_c_major_minor_chords(self):
+        assert convert_chord_to_nashville(parse_chord(text), "C", "major") == expected
+
+    @pytest.mark.parametrize("text,expected", [
+        ("Dm", "2m"),
+        ("Em", "3m"),
+        ("Am", "6m"),
+    ])
+    def test_c_major_minor_chords(self, text, expected):
         """Test minor chords in C major."""
-        assert convert_chord_to_nashville(parse_chord("Dm"), "C", "major") == "2m"
-        assert convert_chord_to_nashville(parse_chord("Em"), "C", "major") == "3m"
-        assert convert_chord_to_nashville(parse_chord("Am"), "C", "major") == "6m"
-
-    def test_c_major_seventh_chords(self):
+        assert convert_chord_to_nashville(parse_chord(text), "C", "major") == expected
+
+    @pytest.mark.parametrize("text,expected", [
+        ("Cmaj7", "1maj7"),
+        ("Dm7", "2m7"),
+        ("G7", "57"),
+    ])
+    def test_c_major_seventh_chords(self, text, expected):
         """Test seventh chords in C major."""
-        assert convert_chord_to_nashville(parse_chord("Cmaj7"), "C", "major") == "1maj7"
-        assert convert_chord_to_nashville(parse_chord("Dm7"), "C", "major") == "2m7"
-        assert convert_chord_to_nashville(parse_chord("G7"), "C", "major") == "57"
-
-    def test_g_major_chords(self):
+        assert convert_chord_to_nashville(parse_chord(text), "C", "major") == expected
+
+    # G major: I ii iii IV V vi vii°
+    @pytest.mark.parametrize("text,expected", [
+        ("G", "1"),
+        ("Am", "2m"),
+        ("Bm", "3m"),
+        ("C", "4"),
+        ("D", "5"),
+        ("Em", "6m"),
+    ])
+    def test_g_major_chords(self, text, expected):
         """Test chords in G major."""
-        # G major: I ii iii IV V vi vii°
-        assert convert_chord_to_nashville(parse_chord("G"), "G", "major") == "1"
-        assert convert_chord_to_nashville(parse_chord("Am"), "G", "major") == "2m"
-        assert convert_chord_to_nashville(parse_chord("Bm"), "G", "major") == "3m"
-        assert convert_chord_to_nashville(parse_chord("C"), "G", "major") == "4"
-        assert convert_chord_to_nashville(parse_chord("D"), "G", "major") == "5"
-        assert convert_chord_to_nashville(parse_chord("Em"), "G", "major") == "6m"
+        assert convert_chord_to_nashville(parse_chord(text), "G", "major") == expected
 
     def test_slash_chords(self):
         """Test slash chord conversion."""
@@ -251,23 +265,29 @@ class TestConvertChordToNashville:
         assert "5" in result
         assert "sus" in result
 
-    def test_flat_keys(self):
+    # F major: F G A Bb C D E
+    @pytest.mark.parametrize("text,expected", [
+        ("F", "1"),
+        ("Gm", "2m"),
+        ("Am", "3m"),
+        ("Bb", "4"),
+        ("C", "5"),
+    ])
+    def test_flat_keys(self, text, expected):
         """Test conversions in flat keys."""
-        # F major: F G A Bb C D E
-        assert convert_chord_to_nashville(parse_chord("F"), "F", "major") == "1"
-        assert convert_chord_to_nashville(parse_chord("Gm"), "F", "major") == "2m"
-        assert convert_chord_to_nashville(parse_chord("Am"), "F", "major") == "3m"
-        assert convert_chord_to_nashville(parse_chord("Bb"), "F", "major") == "4"
-        assert convert_chord_to_nashville(parse_chord("C"), "F", "major") == "5"
-
-    def test_sharp_keys(self):
+        assert convert_chord_to_nashville(parse_chord(text), "F", "major") == expected
+
+    # D major: D E F# G A B C#
+    @pytest.mark.parametrize("text,expected", [
+        ("D", "1"),
+        ("Em", "2m"),
+        ("F#m", "3m"),
+        ("G", "4"),
+        ("A", "5"),
+    ])
+    def test_sharp_keys(self, text, expected):
         """Test conversions in sharp keys."""
-        # D major: D E F# G A B C#
-        assert convert_chord_to_nashville(parse_chord("D"), "D", "major") == "1"
-        assert convert_chord_to_nashville(parse_chord("Em"), "D", "major") == "2m"
-        assert convert_chord_to_nashville(parse_chord("F#m"), "D", "major") == "3m"
-        assert convert_chord_to_nashville(parse_chord("G"), "D", "major") == "4"
-        assert convert_chord_to_nashville(parse_chord("A"), "D", "major") == "5"
+        assert convert_chord_to_nashville(parse_chord(text), "D", "major") == expected
 
     def test_enharmonic_equivalents(self):
         """Test that enharmonic equivalents produce same result."""
@@ -293,6 +313,42 @@ class TestConvertTextToNashville:
         assert convert_text_to_nashville("", "C", "major") is None
 
 
+class TestConvertManyToNashville:
+    """Test batch chord string conversion."""
+
+    def test_matches_convert_text_to_nashville(self):
+        """Test that each result matches the single-chord conversion."""
+        progression = ["Bb", "F/A", "Gm7", "Ebmaj7", "Hello", "C#dim"]
+        expected = [convert_text_to_nashville(c, "F", "major") for c in progression]
+        assert convert_many_to_nashville(progression, "F", "major") == expected
+        assert expected[4] is None
+
+
+class TestMakeConverter:
+    """Test key/mode-specialized converters."""
+
+    def test_matches_convert_chord_to_nashville(self):
+        """Test that specialized converters agree with the generic one."""
+        chords = [parse_chord(c) for c in ["C", "Dm7", "G/B", "Ebmaj7", "F#m7b5", "Bb/D", "Asus4"]]
+        for key in ["C", "G", "Bb", "F#", "Db"]:
+            for mode in ["major", "minor"]:
+                convert = make_converter(key, mode)
+                for chord in chords:
+                    assert convert(chord) == convert_chord_to_nashville(chord, key, mode)
+
+    def test_accepts_enum_key_and_mode(self):
+        """Test that MusicKey/MusicalMode members work like their values."""
+        from models.types import MusicKey, MusicalMode
+        convert = make_converter(MusicKey.G, MusicalMode.MAJOR)
+        assert convert(parse_chord("D/F#")) == "5/7"
+
+    def test_invalid_key_raises_on_convert(self):
+        """Test that an invalid key fails when converting, as before."""
+        convert = make_converter("H", "major")
+        with pytest.raises(ValueError):
+            convert(parse_chord("C"))
+
+
 class TestGetKeySignaturePreference:
     """Test key signature preferences (sharps vs flats)."""
 
@@ -416,7 +472,7 @@ class TestNashvilleConverterIntegration:
         """Test converting progression with slash chords."""
         # C - G/B - Am - F/A in C major
         progression = ["C", "G/B", "Am", "F/A"]
-        results = [convert_text_to_nashville(c, "C", "major") for c in progression]
+        results = convert_many_to_nashville(progression, "C", "major")
 
         assert results[0] == "1"
         assert results[1] == "5/7"  # G/B
@@ -427,7 +483,7 @@ class TestNashvilleConverterIntegration:
         """Test converting 12-bar blues progression in A."""
         # Simplified: A7 - D7 - A7 - E7
         progression = ["A7", "D7", "A7", "E7"]
-        results = [convert_text_to_nashville(c, "A", "major") for c in progression]
+        results = convert_many_to_nashville(progression, "A", "major")
 
         assert results[0] == "17"  # I7
         assert results[1] == "47"  # IV7
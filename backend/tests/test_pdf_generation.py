@@ -9,16 +9,12 @@ This module tests the complete PDF processing pipeline including:
 """
 
 import pytest
-import sys
 from pathlib import Path
 from typing import Dict, Any
 
-# Add project root to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
-from backend.core.pdf_processor import PDFProcessor  # noqa: E402
-from backend.core.text_pdf_handler import extract_chords_from_text_pdf, detect_if_text_pdf  # noqa: E402
-from backend.core.pdf_renderer import render_text_pdf_with_nashville  # noqa: E402
+# The project root is put on sys.path by pytest.ini. The backend modules
+# are imported inside the fixtures and tests that use them, so collecting
+# this file does not pull in the PDF libraries
 
 
 # Fixtures directory paths
@@ -36,9 +32,10 @@ def setup_output_directory():
     # You may want to keep outputs for manual inspection
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def pdf_processor():
-    """Provide a PDFProcessor instance"""
+    """Provide a PDFProcessor instance shared by the whole test session"""
+    from backend.core.pdf_processor import PDFProcessor
     return PDFProcessor()
 
 
@@ -97,29 +94,27 @@ class TestPDFProcessor:
         assert 'chords_found' in result
         assert 'chords_converted' in result
 
-    def test_process_with_different_keys(self, pdf_processor, sample_text_pdf):
+    @pytest.mark.parametrize('key,mode', [
+        ('C', 'major'),
+        ('G', 'major'),
+        ('A', 'minor'),
+        ('D', 'major'),
+    ])
+    def test_process_with_different_keys(self, pdf_processor, sample_text_pdf, key, mode):
         """Test processing with different musical keys"""
-        test_keys = [
-            ('C', 'major'),
-            ('G', 'major'),
-            ('A', 'minor'),
-            ('D', 'major'),
-        ]
+        output_path = OUTPUT_DIR / f'test_output_{key}_{mode}.pdf'
 
-        for key, mode in test_keys:
-            output_path = OUTPUT_DIR / f'test_output_{key}_{mode}.pdf'
-
-            result = pdf_processor.process_pdf(
-                str(sample_text_pdf),
-                str(output_path),
-                key=key,
-                mode=mode
-            )
+        result = pdf_processor.process_pdf(
+            str(sample_text_pdf),
+            str(output_path),
+            key=key,
+            mode=mode
+        )
 
-            assert result['success'] is True, \
-                f"Processing failed for key {key} {mode}: {result.get('error')}"
-            assert output_path.exists(), \
-                f"Output not created for key {key} {mode}"
+        assert result['success'] is True, \
+            f"Processing failed for key {key} {mode}: {result.get('error')}"
+        assert output_path.exists(), \
+            f"Output not created for key {key} {mode}"
 
     def test_invalid_input_path(self, pdf_processor):
         """Test handling of invalid input path"""
@@ -152,11 +147,13 @@ class TestTextPDFHandler:
 
     def test_detect_text_pdf(self, sample_text_pdf):
         """Test detection of text-based PDFs"""
+        from backend.core.text_pdf_handler import detect_if_text_pdf
         is_text = detect_if_text_pdf(str(sample_text_pdf))
         assert isinstance(is_text, bool)
 
     def test_extract_chords_from_text_pdf(self, sample_text_pdf):
         """Test chord extraction from text PDFs"""
+        from backend.core.text_pdf_handler import extract_chords_from_text_pdf
         chords = extract_chords_from_text_pdf(str(sample_text_pdf))
 
         assert isinstance(chords, list)
@@ -176,8 +173,9 @@ class TestPDFRenderer:
 
     def test_render_text_pdf_with_nashville(self, sample_text_pdf):
         """Test rendering Nashville numbers on text PDF"""
-        from core.text_pdf_handler import extract_chords_from_text_pdf
-        from core.nashville_converter import NashvilleConverter
+        from backend.core.text_pdf_handler import extract_chords_from_text_pdf
+        from backend.core.nashville_converter import NashvilleConverter
+        from backend.core.pdf_renderer import render_text_pdf_with_nashville
 
         # Extract chords
         chord_annotations = extract_chords_from_text_pdf(str(sample_text_pdf))
@@ -320,7 +318,7 @@ def run_specific_pdf(pdf_path: str, key: str = 'C', mode: str = 'major') -> Dict
         from tests.test_pdf_generation import run_specific_pdf
         result = run_specific_pdf('path/to/my.pdf', key='G', mode='major')
     """
-    from backend.core.pdf_processor import PDFProcessingError
+    from backend.core.pdf_processor import PDFProcessor, PDFProcessingError
     processor = PDFProcessor()
     output_path = OUTPUT_DIR / f'{Path(pdf_path).stem}_test_output.pdf'
 
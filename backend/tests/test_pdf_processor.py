@@ -0,0 +1,113 @@
+"""
+Unit tests for pdf_processor module
+
+Tests the conversion pipeline on small in-memory PDFs.
+"""
+
+import pytest
+
+from backend.core import pdf_processor
+from backend.core.pdf_processor import PDFProcessor, PDFProcessingError
+from backend.tests.conftest import make_pdf
+
+
+class TestProcessPdf:
+    """Test converting a chart end to end."""
+
+    def test_chords_on_middle_page_only(self):
+        """Test that a chart between a title page and a credits page converts."""
+        data = make_pdf([
+            ["Amazing Grace", "Traditional Hymn", "Words by John Newton, 1779"],
+            ["G C D Em", "Amazing grace how sweet the sound", "Am F G"],
+            ["Words by John Newton"],
+        ])
+
+        result = PDFProcessor().process_pdf(data, key="G", mode="major")
+
+        assert result['success'] is True
+        assert result['total_chords_found'] == 7
+
+    def test_no_chord_candidates_fails_fast(self):
+        """Test that text without any A-G words is rejected."""
+        # Enough lowercase text for the first page to count as text-based
+        lyrics = ["la " * 20, "hmm " * 15]
+        data = make_pdf([lyrics, lyrics, lyrics])
+
+        with pytest.raises(PDFProcessingError, match="No chords detected"):
+            PDFProcessor().process_pdf(data, key="G", mode="major")
+
+
+class TestExtractionCache:
+    """Test reusing extracted chords for repeated uploads."""
+
+    @pytest.fixture
+    def chart(self):
+        """A small chart with chords on its first page."""
+        return make_pdf([["G C D Em", "Amazing grace how sweet the sound", "Am F G",
+                          "That saved a wretch like me"]])
+
+    @pytest.fixture
+    def extraction_calls(self, monkeypatch):
+        """Count calls to the full chord extraction."""
+        calls = []
+        extract = pdf_processor.extract_chords_from_text_pdf
+
+        def counting_extract(*args, **kwargs):
+            calls.append(args)
+            return extract(*args, **kwargs)
+
+        monkeypatch.setattr(pdf_processor, "extract_chords_from_text_pdf", counting_extract)
+        return calls
+
+    def test_same_bytes_extracted_once(self, chart, extraction_calls):
+        """Test that converting one chart into two keys extracts it once."""
+        processor = PDFProcessor()
+
+        in_g = processor.process_pdf(chart, key="G", mode="major")
+        in_d = processor.process_pdf(chart, key="D", mode="major")
+
+        assert len(extraction_calls) == 1
+        assert in_g['total_chords_found'] == in_d['total_chords_found'] == 7
+        assert in_g['result_file_bytes'] != in_d['result_file_bytes']
+
+    def test_different_bytes_extracted_again(self, chart, extraction_calls):
+        """Test that another upload is not served from the cache."""
+        processor = PDFProcessor()
+
+        processor.process_pdf(chart, key="G", mode="major")
+        other_chart = make_pdf([["D A Bm G", "I once was lost but now am found, was blind"]])
+        processor.process_pdf(other_chart, key="G", mode="major")
+
+        assert len(extraction_calls) == 2
+
+    def test_returned_metadata_is_a_copy(self, chart):
+        """Test that editing a result's metadata does not alter the cache."""
+        processor = PDFProcessor()
+
+        first = processor.process_pdf(chart, key="G", mode="major")
+        expected = dict(first['metadata'])
+        first['metadata']['num_pages'] = 99
+        first['metadata']['page_sizes'][0]['width'] = 1
+
+        second = processor.process_pdf(chart, key="G", mode="major")
+
+        assert second['metadata']['num_pages'] == 1
+        assert second['metadata']['page_sizes'][0]['width'] != 1
+        assert second['metadata'].keys() == expected.keys()
+
+    def test_concurrent_requests_share_cache(self, chart, monkeypatch):
+        """Test that requests evicting each other from other threads all succeed."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        monkeypatch.setattr(pdf_processor, "EXTRACTION_CACHE_SIZE", 1)
+        other_chart = make_pdf([["D A Bm G", "I once was lost but now am found, was blind"]])
+        processor = PDFProcessor()
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(
+                lambda data: processor.process_pdf(data, key="G", mode="major"),
+                [chart, other_chart] * 8
+            ))
+
+        assert all(result['success'] for result in results)
+        assert len(processor._extraction_cache) == 1
@@ -0,0 +1,241 @@
+"""
+Unit tests for pdf_renderer module
+
+Tests the overlay content stream and rendering Nashville numbers onto a PDF.
+"""
+
+import io
+import re
+
+import pytest
+
+from backend.core.chord_parser import parse_chord
+from backend.core.nashville_converter import make_converter
+from backend.core.pdf_renderer import (
+    OVERLAY_FONT_PREFIX,
+    build_overlay_content,
+    render_text_pdf_with_nashville
+)
+from backend.core.text_pdf_handler import (
+    ChordAnnotation,
+    extract_chords_from_text_pdf,
+    filter_false_positives
+)
+from backend.tests.conftest import make_pdf
+
+TEXT_RUN = re.compile(rb'(-?[0-9.]+) (-?[0-9.]+) Td \((.*?)\) Tj')
+
+
+def make_chord(text, bbox, font_size=12.0, font_name="Helvetica"):
+    """Build a (ChordAnnotation, Nashville number) pair in C major."""
+    chord = parse_chord(text)
+    annotation = ChordAnnotation(
+        chord=chord,
+        text=text,
+        page_number=0,
+        bbox=bbox,
+        font_size=font_size,
+        font_name=font_name
+    )
+    return annotation, make_converter("C", "major")(chord)
+
+
+def page_content(page):
+    """Concatenate the data of every content stream drawn on a page."""
+    contents = page['/Contents'].get_object()
+    if not isinstance(contents, list):
+        contents = [contents]
+    return b"".join(stream.get_object().get_data() for stream in contents)
+
+
+def with_indirect_contents_array(data):
+    """Rewrite every page's /Contents as an indirect reference to an array."""
+    from PyPDF2 import PdfReader, PdfWriter
+    from PyPDF2.generic import ArrayObject, NameObject
+
+    writer = PdfWriter()
+    for source_page in PdfReader(io.BytesIO(data)).pages:
+        page = writer.add_page(source_page)
+        page[NameObject('/Contents')] = writer._add_object(
+            ArrayObject([page.raw_get('/Contents')])
+        )
+    buffer = io.BytesIO()
+    writer.write(buffer)
+    return buffer.getvalue()
+
+
+def render_in_g(source):
+    """Extract a chart's chords and render it with Nashville numbers in G."""
+    annotations, metadata = extract_chords_from_text_pdf(source)
+    annotations = filter_false_positives(annotations)
+    convert = make_converter("G", "major")
+    numbers = [convert(annotation.chord) for annotation in annotations]
+    return render_text_pdf_with_nashville(source, annotations, numbers, metadata)
+
+
+@pytest.fixture(scope="module")
+def rendered():
+    """Render a three-page chart whose middle page has no chords."""
+    source = make_pdf([
+        ["G C D Em", "Amazing grace how sweet the sound"],
+        ["That saved a wretch like me"],
+        ["Am7 D/F# G"],
+    ])
+    output = render_in_g(source)
+    return source, output
+
+
+class TestBuildOverlayContent:
+    """Test the overlay operators written for one page."""
+
+    def test_single_fill_for_all_rectangles(self):
+        """Test that every white-out rectangle is filled by one operator."""
+        chords = [
+            make_chord("C", (100.0, 200.0, 110.0, 212.0)),
+            make_chord("F", (150.0, 200.0, 160.0, 212.0)),
+            make_chord("G", (200.0, 200.0, 210.0, 212.0)),
+        ]
+
+        content, _ = build_overlay_content(chords, 612, 792)
+        ops = content.split(b"\n")
+
+        assert ops[0] == b"1 1 1 rg"
+        assert sum(op.endswith(b" re") for op in ops) == 3
+        assert ops.count(b"f") == 1
+        assert ops.index(b"f") == 4
+
+    def test_no_chords_no_fill(self):
+        """Test that an empty page draws no rectangles and no fill."""
+        content, fonts = build_overlay_content([], 612, 792)
+
+        assert b"re" not in content
+        assert b"\nf\n" not in content
+        assert fonts == []
+
+    def test_relative_text_offsets(self):
+        """Test that each number's Td is relative to the previous one."""
+        chords = [
+            make_chord("C", (100.0, 200.0, 110.0, 212.0)),
+            make_chord("G", (200.0, 300.0, 210.0, 312.0)),
+        ]
+
+        content, _ = build_overlay_content(chords, 612, 792)
+        runs = TEXT_RUN.findall(content)
+
+        # First run is relative to the text origin; 792 - 212 + 12 * 0.2
+        assert runs[0] == (b"100", b"582.4", b"1")
+        assert runs[1] == (b"100", b"-100", b"5")
+
+    def test_offsets_add_up_to_positions(self):
+        """Test that summed offsets land every number where it belongs."""
+        positions = [(72.3 + 41.7 * i, 100.0 + 13.1 * (i % 5)) for i in range(12)]
+        chords = [
+            make_chord("C", (x, top, x + 10.0, top + 12.0)) for x, top in positions
+        ]
+
+        content, _ = build_overlay_content(chords, 612, 792)
+
+        x = y = 0.0
+        drawn = []
+        for dx, dy, _ in TEXT_RUN.findall(content):
+            x += float(dx)
+            y += float(dy)
+            drawn.append((round(x, 3), round(y, 3)))
+        expected = [(round(x, 3), round(792 - top - 12.0 + 2.4, 3)) for x, top in positions]
+
+        assert drawn == expected
+
+    def test_font_set_once_per_font_and_size(self):
+        """Test that alternating fonts and sizes are grouped before drawing."""
+        chords = [
+            make_chord(text, (50.0 * i, 200.0, 50.0 * i + 40.0, 212.0), font_size=size, font_name=font)
+            for i, (text, size, font) in enumerate([
+                ("C", 12.0, "Helvetica"),
+                ("G", 12.0, "Times-Roman"),
+                ("F", 14.0, "Helvetica"),
+                ("Am", 12.0, "Helvetica"),
+                ("Dm", 12.0, "Times-Roman"),
+            ])
+        ]
+
+        content, fonts = build_overlay_content(chords, 612, 792)
+        font_ops = re.findall(rb'(\S+) (\S+) Tf', content)
+
+        assert font_ops == [
+            (OVERLAY_FONT_PREFIX.encode() + b"Helvetica", b"12"),
+            (OVERLAY_FONT_PREFIX.encode() + b"Helvetica", b"14"),
+            (OVERLAY_FONT_PREFIX.encode() + b"Times-Roman", b"12"),
+        ]
+        assert fonts == ["Helvetica", "Times-Roman"]
+        assert [run[2] for run in TEXT_RUN.findall(content)] == [b"1", b"6m", b"4", b"5", b"2m"]
+
+    def test_invalid_page_dimensions(self):
+        """Test that non-positive page sizes are rejected."""
+        with pytest.raises(ValueError):
+            build_overlay_content([], 0, 792)
+
+
+class TestRenderTextPdfWithNashville:
+    """Test rendering a converted chart and reading it back."""
+
+    def test_numbers_drawn_on_chord_pages(self, rendered):
+        """Test that pages with chords now draw their Nashville numbers."""
+        from PyPDF2 import PdfReader
+
+        _, output = rendered
+        pages = PdfReader(io.BytesIO(output)).pages
+
+        # The whited-out chords stay in the text layer and merge with the
+        # numbers drawn over them in text extraction, so read the numbers
+        # from the page's content stream instead
+        drawn = [
+            [run[2] for run in TEXT_RUN.findall(page_content(page))]
+            for page in pages
+        ]
+
+        assert drawn[0] == [b"1", b"4", b"5", b"6m"]
+        assert drawn[1] == []
+        assert sorted(drawn[2]) == [b"1", b"2m7", b"5/7"]
+
+    def test_overlay_fonts_registered(self, rendered):
+        """Test that chord pages reference the overlay's fonts."""
+        from PyPDF2 import PdfReader
+
+        _, output = rendered
+        pages = PdfReader(io.BytesIO(output)).pages
+
+        for page_num in (0, 2):
+            font_names = pages[page_num]['/Resources']['/Font'].keys()
+            assert OVERLAY_FONT_PREFIX + "Helvetica" in font_names
+            assert any(not name.startswith(OVERLAY_FONT_PREFIX) for name in font_names)
+
+    def test_pages_without_chords_unchanged(self, rendered):
+        """Test that a page without chords is passed through as it was."""
+        from PyPDF2 import PdfReader
+
+        source, output = rendered
+        source_page = PdfReader(io.BytesIO(source)).pages[1]
+        output_page = PdfReader(io.BytesIO(output)).pages[1]
+
+        assert page_content(output_page) == page_content(source_page)
+        assert (
+            output_page['/Resources']['/Font'].keys()
+            == source_page['/Resources']['/Font'].keys()
+        )
+        assert output_page.extract_text() == source_page.extract_text()
+
+    def test_indirect_contents_array_kept(self):
+        """Test that a page whose /Contents is an indirect array keeps its text."""
+        from PyPDF2 import PdfReader
+        from PyPDF2.generic import StreamObject
+
+        source = with_indirect_contents_array(make_pdf([
+            ["G C D Em", "Amazing grace how sweet the sound"],
+        ]))
+
+        page = PdfReader(io.BytesIO(render_in_g(source))).pages[0]
+        streams = [stream.get_object() for stream in page['/Contents'].get_object()]
+
+        assert all(isinstance(stream, StreamObject) for stream in streams)
+        assert b"(Amazing grace how sweet the sound) Tj" in page_content(page)
+        assert [run[2] for run in TEXT_RUN.findall(page_content(page))] == [b"1", b"4", b"5", b"6m"]
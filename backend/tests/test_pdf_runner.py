@@ -12,11 +12,13 @@ Example:
     python test_pdf_runner.py tests/fixtures/input/sample.pdf --key G --mode major -v
 """
 
+import os
+import stat
 import sys
+import time
 import argparse
 import traceback
 from pathlib import Path
-from datetime import datetime
 from typing import Dict, Any
 
 # Add project root to path
@@ -65,25 +67,27 @@ def print_warning(text: str):
 
 def validate_input(input_path: Path) -> bool:
     """Validate input PDF exists and is readable"""
-    if not input_path.exists():
+    # One stat call answers existence, file type and size
+    try:
+        input_stat = os.stat(input_path)
+    except (FileNotFoundError, NotADirectoryError):
         print_error(f"Input file does not exist: {input_path}")
         return False
 
-    if not input_path.is_file():
+    if not stat.S_ISREG(input_stat.st_mode):
         print_error(f"Input path is not a file: {input_path}")
         return False
 
     if input_path.suffix.lower() != '.pdf':
         print_warning(f"Input file does not have .pdf extension: {input_path}")
 
-    file_size = input_path.stat().st_size
-    file_size_mb = file_size / (1024 * 1024)
+    file_size = input_stat.st_size
 
-    if file_size_mb > 10:
-        print_error(f"File size ({file_size_mb:.2f} MB) exceeds 10 MB limit")
+    if file_size > 10 * 1024 * 1024:
+        print_error(f"File size ({file_size / (1024 * 1024):.2f} MB) exceeds 10 MB limit")
         return False
 
-    print_success(f"Input file validated: {input_path.name} ({file_size_mb:.2f} MB)")
+    print_success(f"Input file validated: {input_path.name} ({file_size / (1024 * 1024):.2f} MB)")
     return True
 
 
@@ -122,7 +126,7 @@ def run_pdf_test(
         print_info(f"Key: {key} {mode}")
         print_info(f"Output: {output_path.name}")
 
-        start_time = datetime.now()
+        start_ns = time.perf_counter_ns()
 
         process_result = processor.process_pdf(
             str(input_path),
@@ -131,8 +135,7 @@ def run_pdf_test(
             mode=mode
         )
 
-        end_time = datetime.now()
-        duration = (end_time - start_time).total_seconds()
+        duration = (time.perf_counter_ns() - start_ns) / 1e9
 
         # Check results
         if process_result.get('success'):
@@ -146,30 +149,36 @@ def run_pdf_test(
             # Print statistics
             if verbose:
                 print_info("\nProcessing Statistics:")
-                print(f"  PDF Type: {process_result.get('pdf_type', 'unknown')}")
-                print(f"  Pages Processed: {process_result.get('pages_processed', 0)}")
-                print(f"  Chords Found: {process_result.get('chords_found', 0)}")
-                print(f"  Chords Converted: {process_result.get('chords_converted', 0)}")
+                # Collect the block and print it with a single write
+                stats_lines = [
+                    f"  PDF Type: {process_result.get('pdf_type', 'unknown')}",
+                    f"  Pages Processed: {process_result.get('pages_processed', 0)}",
+                    f"  Chords Found: {process_result.get('chords_found', 0)}",
+                    f"  Chords Converted: {process_result.get('chords_converted', 0)}",
+                ]
 
                 if 'render_quality' in process_result:
                     quality = process_result['render_quality']
-                    print(f"  Render Quality: {quality.get('score', 0):.1f}/100")
-                    print(f"  Font Match Rate: {quality.get('font_match_rate', 0):.1f}%")
-                    print(f"  Size Match Rate: {quality.get('size_match_rate', 0):.1f}%")
+                    stats_lines.append(f"  Render Quality: {quality.get('score', 0):.1f}/100")
+                    stats_lines.append(f"  Font Match Rate: {quality.get('font_match_rate', 0):.1f}%")
+                    stats_lines.append(f"  Size Match Rate: {quality.get('size_match_rate', 0):.1f}%")
 
                 if 'ocr_confidence' in process_result:
                     ocr = process_result['ocr_confidence']
-                    print(f"  OCR Mean Confidence: {ocr.get('mean', 0):.1f}%")
-                    print(f"  OCR Median Confidence: {ocr.get('median', 0):.1f}%")
+                    stats_lines.append(f"  OCR Mean Confidence: {ocr.get('mean', 0):.1f}%")
+                    stats_lines.append(f"  OCR Median Confidence: {ocr.get('median', 0):.1f}%")
 
-            # Verify output exists
-            if output_path.exists():
-                output_size = output_path.stat().st_size / 1024
-                print_success(f"Output file created: {output_path.name} ({output_size:.1f} KB)")
-            else:
+                print("\n".join(stats_lines))
+
+            # Verify output exists; one stat call gives existence and size
+            try:
+                output_size = os.stat(output_path).st_size / 1024
+            except (FileNotFoundError, NotADirectoryError):
                 print_error("Output file was not created!")
                 result['success'] = False
                 result['error'] = "Output file not found"
+            else:
+                print_success(f"Output file created: {output_path.name} ({output_size:.1f} KB)")
 
         else:
             error_msg = process_result.get('error', 'Unknown error')
@@ -0,0 +1,350 @@
+"""
+Unit tests for text_pdf_handler module
+
+Tests chord extraction and the post-extraction passes.
+"""
+
+import io
+import struct
+import zlib
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+from backend.core import text_pdf_handler
+from backend.core.chord_parser import parse_chord
+from backend.core.text_pdf_handler import (
+    PARALLEL_MIN_PAGES,
+    ChordAnnotation,
+    detect_if_text_pdf,
+    extract_chords_from_text_pdf,
+    open_text_pdf,
+    sample_rules_out_chords,
+    _extract_page_words,
+    group_chords_by_proximity,
+    filter_false_positives,
+    estimate_text_width,
+    estimate_text_widths
+)
+from backend.tests.conftest import make_pdf
+
+
+def make_object_stream_pdf(lines):
+    """
+    Build a one-page PDF 1.5 whose page, resources and font dictionaries
+    live in a compressed object stream, so '/Font' never appears in the
+    raw bytes.
+    """
+    content = ("BT /F1 12 Tf 72 720 Td 20 TL "
+               + " ".join("(%s) '" % line for line in lines) + " ET").encode()
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+        b"/Resources << /Font << /F1 4 0 R >> >> /Contents 5 0 R >>",
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+
+    # Object stream: "number offset" pairs followed by the objects
+    index, body = [], b""
+    for number, obj in enumerate(objects, 1):
+        index.append(b"%d %d" % (number, len(body)))
+        body += obj + b"\n"
+    index = b" ".join(index) + b"\n"
+    packed = zlib.compress(index + body)
+
+    out = b"%PDF-1.5\n"
+    offsets = {5: len(out)}
+    out += b"5 0 obj\n<< /Length %d >>\nstream\n" % len(content)
+    out += content + b"\nendstream\nendobj\n"
+    offsets[6] = len(out)
+    out += (b"6 0 obj\n<< /Type /ObjStm /N %d /First %d /Filter /FlateDecode /Length %d >>\nstream\n"
+            % (len(objects), len(index), len(packed)))
+    out += packed + b"\nendstream\nendobj\n"
+    offsets[7] = len(out)
+
+    # Cross-reference stream: objects 1-4 are compressed in object 6
+    xref = struct.pack(">BIH", 0, 0, 65535)
+    xref += b"".join(struct.pack(">BIH", 2, 6, i) for i in range(len(objects)))
+    xref += b"".join(struct.pack(">BIH", 1, offsets[n], 0) for n in (5, 6, 7))
+    out += (b"7 0 obj\n<< /Type /XRef /Size 8 /W [1 4 2] /Root 1 0 R /Length %d >>\nstream\n"
+            % len(xref))
+    out += xref + b"\nendstream\nendobj\n"
+    out += b"startxref\n%d\n%%%%EOF\n" % offsets[7]
+    return out
+
+
+def make_image_pdf():
+    """Build a one-page PDF that holds only an image, like a scan."""
+    from PIL import Image
+
+    buffer = io.BytesIO()
+    Image.new("L", (200, 100), color=255).save(buffer, format="PDF")
+    return buffer.getvalue()
+
+
+def make_annotation(text, page_number=0, bbox=(0.0, 0.0, 10.0, 12.0), font_size=12.0):
+    """Build a ChordAnnotation for a chord string."""
+    return ChordAnnotation(
+        chord=parse_chord(text),
+        text=text,
+        page_number=page_number,
+        bbox=bbox,
+        font_size=font_size
+    )
+
+
+class TestGroupChordsByProximity:
+    """Test grouping chords into lines."""
+
+    def test_groups_by_line_and_page(self):
+        """Test that chords split on vertical distance and page breaks."""
+        g = make_annotation("G", bbox=(100.0, 100.0, 110.0, 112.0))
+        c = make_annotation("C", bbox=(10.0, 105.0, 20.0, 117.0))
+        d = make_annotation("D", bbox=(10.0, 200.0, 20.0, 212.0))
+        em = make_annotation("Em", page_number=1, bbox=(10.0, 100.0, 25.0, 112.0))
+
+        groups = group_chords_by_proximity([d, em, g, c])
+
+        assert [[a.text for a in group] for group in groups] == [["G", "C"], ["D"], ["Em"]]
+
+    def test_empty_input(self):
+        """Test grouping an empty list."""
+        assert group_chords_by_proximity([]) == []
+
+
+class TestFilterFalsePositives:
+    """Test false positive filtering."""
+
+    def test_drops_headings_and_footnotes(self):
+        """Test that chords outside the 8-24pt range are removed."""
+        annotations = [
+            make_annotation("C", font_size=12.0),
+            make_annotation("D", font_size=30.0),
+            make_annotation("E", font_size=6.0),
+            make_annotation("F", font_size=24.0),
+        ]
+
+        filtered = filter_false_positives(annotations)
+
+        assert [a.text for a in filtered] == ["C", "F"]
+
+    def test_range_bounds_are_exact(self):
+        """Test sizes just inside and just outside the 8-24pt bounds."""
+        annotations = [
+            make_annotation("C", font_size=7.9),
+            make_annotation("D", font_size=8.0),
+            make_annotation("E", font_size=24.0),
+            make_annotation("F", font_size=24.1),
+        ]
+
+        filtered = filter_false_positives(annotations)
+
+        assert [a.text for a in filtered] == ["D", "E"]
+
+
+class TestEstimateTextWidths:
+    """Test text width measurement."""
+
+    def test_matches_single_estimates(self):
+        """Test that the batch form agrees with estimate_text_width."""
+        texts = ["1", "5/7", "2m7"]
+        sizes = [12.0, 10.0, 14.0]
+        fonts = ["Helvetica", "Courier-Bold", "Times-Roman"]
+
+        widths = estimate_text_widths(texts, sizes, fonts)
+
+        assert widths == [
+            estimate_text_width(t, s, f) for t, s, f in zip(texts, sizes, fonts)
+        ]
+        assert widths[1] == 3 * 10.0 * 0.60
+
+    def test_uses_font_metrics(self):
+        """Test that widths follow the font's glyph widths."""
+        assert estimate_text_width("1", 10.0) < estimate_text_width("m", 10.0)
+        assert estimate_text_width("5", 12.0, "ArialMT") == estimate_text_width("5", 12.0)
+
+
+class TestDetectIfTextPdf:
+    """Test text-based PDF detection and its raw-bytes pre-check."""
+
+    LYRICS = ["G C D Em", "Amazing grace how sweet the sound that saved a wretch like me"]
+
+    def test_text_pdf(self):
+        """Test that a normal text PDF is detected."""
+        data = make_pdf([self.LYRICS])
+        assert text_pdf_handler._may_contain_fonts(data) is True
+        assert detect_if_text_pdf(data) is True
+
+    def test_image_only_pdf(self):
+        """Test that a PDF without fonts is rejected by the pre-check."""
+        data = make_image_pdf()
+        assert text_pdf_handler._may_contain_fonts(data) is False
+        assert detect_if_text_pdf(data) is False
+
+    def test_fonts_in_object_stream(self):
+        """Test that fonts hidden in an object stream are still parsed."""
+        data = make_object_stream_pdf(self.LYRICS)
+        assert b"/Font" not in data
+        assert text_pdf_handler._may_contain_fonts(data) is True
+        assert detect_if_text_pdf(data) is True
+
+    def test_non_bytes_input(self):
+        """Test that an argument the pre-check cannot scan returns False."""
+        assert detect_if_text_pdf("/path/to/chart.pdf") is False
+
+
+class TestSampleRulesOutChords:
+    """Test the first/last page check for chord candidates."""
+
+    def test_chords_on_middle_page_only(self):
+        """Test that title and credits pages do not rule out chords."""
+        pdf = open_text_pdf(make_pdf([
+            ["Amazing Grace", "Traditional Hymn"],
+            ["G C D Em", "Am F G"],
+            ["Words by John Newton"],
+        ]))
+        try:
+            assert sample_rules_out_chords(pdf) is False
+        finally:
+            pdf.close()
+
+    def test_text_without_chord_candidates(self):
+        """Test that text pages with no A-G words rule out chords."""
+        pdf = open_text_pdf(make_pdf([["la la la"], ["hmm hmm"], ["la la la"]]))
+        try:
+            assert sample_rules_out_chords(pdf) is True
+        finally:
+            pdf.close()
+
+    def test_pages_without_text_are_no_evidence(self):
+        """Test that blank first and last pages do not rule out chords."""
+        pdf = open_text_pdf(make_pdf([[], ["la la la"], []]))
+        try:
+            assert sample_rules_out_chords(pdf) is False
+        finally:
+            pdf.close()
+
+    def test_short_documents_are_not_sampled(self):
+        """Test that documents below SAMPLE_MIN_PAGES are never ruled out."""
+        pdf = open_text_pdf(make_pdf([["la la la"], ["la la la"]]))
+        try:
+            assert sample_rules_out_chords(pdf) is False
+        finally:
+            pdf.close()
+
+
+class TestExtractPageWords:
+    """Test the layout-based word extraction."""
+
+    def test_matches_pdfplumber_words(self):
+        """Test that words match page.extract_words() exactly."""
+        data = make_pdf([["G   D/F#  Em7", "Amazing grace, how sweet"], ["Cmaj7 Am"]])
+        fast_pdf = open_text_pdf(data)
+        plain_pdf = open_text_pdf(data)
+        try:
+            for fast_page, plain_page in zip(fast_pdf.pages, plain_pdf.pages):
+                assert _extract_page_words(fast_page) == plain_page.extract_words()
+        finally:
+            fast_pdf.close()
+            plain_pdf.close()
+
+
+    def test_falls_back_when_internals_change(self, monkeypatch):
+        """Test that missing pdfplumber internals fall back to extract_words()."""
+        def missing_internals(objs):
+            raise AttributeError("'LTPage' object has no attribute '_objs'")
+
+        monkeypatch.setattr(text_pdf_handler, "_iter_layout_chars", missing_internals)
+        data = make_pdf([["G   D/F#  Em7", "Amazing grace, how sweet"]])
+        fast_pdf = open_text_pdf(data)
+        plain_pdf = open_text_pdf(data)
+        try:
+            words = _extract_page_words(fast_pdf.pages[0])
+            assert words == plain_pdf.pages[0].extract_words()
+        finally:
+            fast_pdf.close()
+            plain_pdf.close()
+
+class TestParallelExtraction:
+    """Test extracting long documents across the process pool."""
+
+    @pytest.fixture
+    def long_pdf(self):
+        """A chart long enough to be split across workers."""
+        pages = [
+            [f"G C/E D{page % 3 + 7}", "Amazing grace", "Em Am7 Dsus4"]
+            for page in range(PARALLEL_MIN_PAGES + 2)
+        ]
+        return make_pdf(pages)
+
+    @pytest.fixture(autouse=True)
+    def shut_down_pool(self):
+        """Stop any worker processes a test started."""
+        yield
+        text_pdf_handler._discard_extract_pool()
+
+    def test_matches_serial_extraction(self, long_pdf, monkeypatch):
+        """Test that a pooled run returns the serial chords and sizes, in order."""
+        monkeypatch.setenv("PDF_EXTRACT_WORKERS", "1")
+        serial_chords, serial_metadata = extract_chords_from_text_pdf(long_pdf)
+
+        monkeypatch.setenv("PDF_EXTRACT_WORKERS", "3")
+        chords, metadata = extract_chords_from_text_pdf(long_pdf)
+
+        assert text_pdf_handler._extract_pool_size == 2
+        assert chords == serial_chords
+        assert metadata == serial_metadata
+        assert [a.page_number for a in chords] == sorted(a.page_number for a in chords)
+        assert len(metadata['page_sizes']) == PARALLEL_MIN_PAGES + 2
+
+    def test_broken_pool_falls_back_to_serial(self, long_pdf, monkeypatch):
+        """Test that a dead pool is discarded and the pages extracted serially."""
+        class BrokenPool:
+            def submit(self, *args, **kwargs):
+                raise BrokenProcessPool("worker died")
+
+            def shutdown(self, wait=True, cancel_futures=False):
+                pass
+
+        monkeypatch.setenv("PDF_EXTRACT_WORKERS", "1")
+        serial_result = extract_chords_from_text_pdf(long_pdf)
+
+        broken_pool = BrokenPool()
+        monkeypatch.setattr(text_pdf_handler, "_extract_pool", broken_pool)
+        monkeypatch.setattr(text_pdf_handler, "_extract_pool_size", 1)
+        monkeypatch.setenv("PDF_EXTRACT_WORKERS", "2")
+
+        assert extract_chords_from_text_pdf(long_pdf) == serial_result
+        assert text_pdf_handler._extract_pool is None
+
+    def test_pool_kept_across_document_lengths(self, monkeypatch):
+        """Test that documents shorter than the worker count reuse one pool."""
+        monkeypatch.setenv("PDF_EXTRACT_WORKERS", str(PARALLEL_MIN_PAGES + 4))
+        page = ["G C D Em", "Amazing grace"]
+
+        extract_chords_from_text_pdf(make_pdf([page] * PARALLEL_MIN_PAGES))
+        pool = text_pdf_handler._extract_pool
+        chords, _ = extract_chords_from_text_pdf(make_pdf([page] * (PARALLEL_MIN_PAGES + 1)))
+
+        assert text_pdf_handler._extract_pool is pool
+        assert text_pdf_handler._extract_pool_size == PARALLEL_MIN_PAGES + 3
+        assert len(chords) == 4 * (PARALLEL_MIN_PAGES + 1)
+
+    def test_default_workers_follow_cpu_affinity(self, monkeypatch):
+        """Test that the default pool size counts only the CPUs we may use."""
+        monkeypatch.delenv("PDF_EXTRACT_WORKERS", raising=False)
+        monkeypatch.setattr(text_pdf_handler.os, "cpu_count", lambda: 64)
+        monkeypatch.setattr(
+            text_pdf_handler.os, "sched_getaffinity", lambda pid: {0, 1}, raising=False
+        )
+
+        assert text_pdf_handler._extract_worker_count(PARALLEL_MIN_PAGES + 10) == 2
+
+    def test_default_workers_without_affinity(self, monkeypatch):
+        """Test that platforms without sched_getaffinity use the CPU count."""
+        monkeypatch.delenv("PDF_EXTRACT_WORKERS", raising=False)
+        monkeypatch.setattr(text_pdf_handler.os, "cpu_count", lambda: 3)
+        monkeypatch.delattr(text_pdf_handler.os, "sched_getaffinity", raising=False)
+
+        assert text_pdf_handler._extract_worker_count(PARALLEL_MIN_PAGES + 10) == 3
@@ -1,11 +1,22 @@
 from enum import Enum
-from typing import List
+from functools import cache
+from typing import FrozenSet, List
 
 
 class ValidationEnum(Enum):
+    @classmethod
+    @cache
+    def _value_set(cls) -> FrozenSet[str]:
+        # Built once per enum class; members never change after creation
+        return frozenset(item.value for item in cls)
+
     @classmethod
     def is_valid(cls, value: str) -> bool:
-        return any(value == item.value for item in cls)
+        try:
+            return value in cls._value_set()
+        except TypeError:
+            # Unhashable values can't be members
+            return False
 
     @classmethod
     def get_valid_values(cls) -> List[str]: